@@ -1,11 +1,21 @@
+import sys
 import logging
 from rich.logging import RichHandler
 
+# Rich's styled rendering is only worth its per-record cost on an interactive terminal.
+# RichHandler prints the time and level itself; the plain handler needs them in its format.
+if sys.stderr.isatty():
+    handler = RichHandler()
+else:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    ))
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format="%(name)s - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[RichHandler()]
+    handlers=[handler]
 )
 
 
@@ -1,8 +1,26 @@
+import sys
 import uvicorn
 import logging
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# uvloop has no Windows build; winloop is the drop-in equivalent there
+loop = "uvloop"
+if sys.platform == "win32":
+    try:
+        import winloop
+        winloop.install()
+    except ImportError:
+        pass
+    loop = "asyncio"
+
 logger.info(f"Coordinator node starting on {settings.HOST}:{settings.PORT}")
-uvicorn.run("services.coordinator.node.server:app", host=settings.HOST, port=settings.PORT, log_config=None)
+uvicorn.run(
+    "services.coordinator.node.server:app",
+    host=settings.HOST,
+    port=settings.PORT,
+    loop=loop,
+    http="httptools",
+    log_config=None
+)
@@ -10,11 +10,12 @@ name = "coordinator" # Define the name explicitly
 
 identity_dir = f".koi/{name}"
 cache_dir = f".koi/{name}/rid_cache_{name}"
-# Remove existing directories if they exist
-shutil.rmtree(identity_dir, ignore_errors=True)
-shutil.rmtree(cache_dir, ignore_errors=True)
+# Start from a clean slate only when asked; by default reuse the warm cache across restarts
+if os.environ.get("KOI_WIPE_CACHE") == "1":
+    shutil.rmtree(identity_dir, ignore_errors=True)
+    shutil.rmtree(cache_dir, ignore_errors=True)
 
-# Recreate the directories
+# Create the directories if they don't exist yet
 os.makedirs(identity_dir, exist_ok=True)
 os.makedirs(cache_dir, exist_ok=True)
 
@@ -11,6 +11,9 @@ from ..core import node
 
 logger = logging.getLogger(__name__)
 
+# This node's NEW event, built on first handshake; the identity bundle doesn't change while running
+_IDENTITY_EVENT = None
+
 @node.processor.register_handler(HandlerType.Network, rid_types=[KoiNetNode])
 def handshake_handler(proc: ProcessorInterface, kobj: KnowledgeObject):
     logger.info("Handling node handshake")
@@ -18,9 +21,13 @@ def handshake_handler(proc: ProcessorInterface, kobj: KnowledgeObject):
     if kobj.event_type != EventType.NEW:
         return
 
+    global _IDENTITY_EVENT
+    if _IDENTITY_EVENT is None:
+        _IDENTITY_EVENT = Event.from_bundle(EventType.NEW, proc.identity.bundle)
+
     logger.info("Sharing this node's bundle with peer")
     proc.network.push_event_to(
-        event=Event.from_bundle(EventType.NEW, proc.identity.bundle),
+        event=_IDENTITY_EVENT,
         node=kobj.rid,
         flush=True
     )
@@ -1,6 +1,6 @@
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, BackgroundTasks
 from koi_net.processor.knowledge_object import KnowledgeSource
 from koi_net.protocol.api_models import (
     PollEvents,
@@ -39,12 +39,18 @@ app = FastAPI(
     version="1.0.0"
 )
 
-@app.post(BROADCAST_EVENTS_PATH)
-def broadcast_events(req: EventsPayload):
-    logger.info(f"Request to {BROADCAST_EVENTS_PATH}, received {len(req.events)} event(s)")
-    for event in req.events:
+def _drain_events(events):
+    for event in events:
         node.processor.handle(event=event, source=KnowledgeSource.External)
+
+@app.post(BROADCAST_EVENTS_PATH, response_model=None)
+def broadcast_events(req: EventsPayload, background: BackgroundTasks):
+    logger.info(f"Request to {BROADCAST_EVENTS_PATH}, received {len(req.events)} event(s)")
+    # Queue the events after the response is sent so the request isn't held
+    background.add_task(_drain_events, req.events)
     
+# The typed returns below are serialized straight to JSON bytes by FastAPI's pydantic-core
+# path; the payloads are already model instances, so response validation doesn't rebuild them
 @app.post(POLL_EVENTS_PATH)
 def poll_events(req: PollEvents) -> EventsPayload:
     logger.info(f"Request to {POLL_EVENTS_PATH}")
@@ -62,5 +68,3 @@ def fetch_manifests(req: FetchManifests) -> ManifestsPayload:
 @app.post(FETCH_BUNDLES_PATH)
 def fetch_bundles(req: FetchBundles) -> BundlesPayload:
     return node.network.response_handler.fetch_bundles(req)
-    
-
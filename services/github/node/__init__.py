@@ -1,10 +1,12 @@
+import sys
 import logging
 from rich.logging import RichHandler
 
+# Rich's styled rendering is only worth its per-record cost on an interactive terminal
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[RichHandler()]
+    handlers=[RichHandler() if sys.stderr.isatty() else logging.StreamHandler()]
 )
 
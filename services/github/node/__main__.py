@@ -1,8 +1,27 @@
+import sys
 import uvicorn
 import logging
 from .config import HOST, PORT
 
 logger = logging.getLogger(__name__)
 
+# uvloop has no Windows build; winloop is the drop-in equivalent there
+loop = "uvloop"
+if sys.platform == "win32":
+    try:
+        import winloop
+        winloop.install()
+    except ImportError:
+        pass
+    loop = "asyncio"
+
 logger.info(f"GitHub sensor node starting on {HOST}:{PORT}")
-uvicorn.run("services.github.node.server:app", host=HOST, port=PORT, log_config=None, reload=True)
\ No newline at end of file
+uvicorn.run(
+    "services.github.node.server:app",
+    host=HOST,
+    port=PORT,
+    loop=loop,
+    http="httptools",
+    log_config=None,
+    reload=True
+)
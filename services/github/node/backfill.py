@@ -1,126 +1,277 @@
+import asyncio
+import functools
 import logging
-from github import Github, GithubException, RateLimitExceededException
-from github.Commit import Commit
+import sys
+from typing import AsyncIterator
+import httpx
 from rid_lib.ext import Bundle
 # Assuming GithubCommit RID type is accessible
-from .types import GithubCommit 
-from .core import node
+from .types import GithubCommit
+from .core import handle_bundles
 from .config import (
     GITHUB_TOKEN, MONITORED_REPOS,
-    LAST_PROCESSED_SHA, update_state_file 
+    LAST_PROCESSED_SHA, LAST_PUSHED_AT, update_state_bulk
 )
 
 logger = logging.getLogger(__name__)
 
-# Initialize GitHub client (authenticated if token provided)
-github_client = Github(GITHUB_TOKEN) if GITHUB_TOKEN else Github()
-logger.info(f"GitHub client initialized. Authenticated: {bool(GITHUB_TOKEN)}")
+GITHUB_API_URL = "https://api.github.com"
+# Largest page size the commits endpoint accepts (PyGithub defaulted to 30)
+COMMITS_PER_PAGE = 100
+
+logger.info(f"GitHub REST client configured. Authenticated: {bool(GITHUB_TOKEN)}")
+
+class RateLimitExceeded(Exception):
+    """Raised when GitHub reports the API rate limit as exhausted."""
+
+def _make_client() -> httpx.AsyncClient:
+    """Builds the HTTP/2 client used for GitHub REST calls (authenticated if token provided)."""
+    headers = {
+        "Accept": "application/vnd.github+json",
+        # Commit JSON compresses several-fold; httpx decodes the body transparently
+        "Accept-Encoding": "gzip, deflate",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if GITHUB_TOKEN:
+        headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+    return httpx.AsyncClient(base_url=GITHUB_API_URL, headers=headers, http2=True, timeout=30.0)
+
+@functools.lru_cache(maxsize=None)
+def _resolve_repo(repo_full_name: str) -> tuple[str, str]:
+    """
+    Splits 'owner/repo' once per process; repeated backfill runs reuse the result.
+    Both parts are interned since every commit RID for the repo shares them.
+    """
+    owner, repo_name_only = repo_full_name.split('/')
+    return sys.intern(owner), sys.intern(repo_name_only)
+
+def _check_response(response: httpx.Response):
+    """Raises RateLimitExceeded for exhausted quota, httpx.HTTPStatusError for other failures."""
+    if response.status_code in (403, 429) and response.headers.get("x-ratelimit-remaining") == "0":
+        raise RateLimitExceeded(f"Rate limit exceeded (resets at {response.headers.get('x-ratelimit-reset')})")
+    response.raise_for_status()
+
+async def _fetch_commits(
+    client: httpx.AsyncClient, owner: str, repo: str, since_sha: str | None
+) -> AsyncIterator[dict]:
+    """
+    Yields commit JSON objects newest-first, following the `Link: rel="next"` header,
+    until since_sha is seen or there are no more pages.
+    """
+    url = f"/repos/{owner}/{repo}/commits"
+    params = {"per_page": COMMITS_PER_PAGE}
+    while url:
+        response = await client.get(url, params=params)
+        _check_response(response)
+        for commit in response.json():
+            if since_sha and commit["sha"] == since_sha:
+                logger.info(f"Found last processed SHA {since_sha} in {owner}/{repo}. Stopping fetch for this repo.")
+                return
+            yield commit
+        # The next link is absolute and already carries the query string
+        url = response.links.get("next", {}).get("url")
+        params = None
+
+async def _fetch_pushed_at(client: httpx.AsyncClient, owner: str, repo: str) -> str | None:
+    """Returns the repository's `pushed_at` timestamp (time of the last push to any branch)."""
+    response = await client.get(f"/repos/{owner}/{repo}")
+    _check_response(response)
+    return response.json().get("pushed_at")
+
+async def _compare_commits(
+    client: httpx.AsyncClient, owner: str, repo: str, base_sha: str
+) -> list[dict] | None:
+    """
+    Returns the commits after base_sha on the default branch, oldest-first, using a single
+    `compare/{base}...HEAD` call. Returns None when the delta can't be served in one response
+    (base SHA unknown to GitHub, or more commits than the compare endpoint returns), in which
+    case the caller falls back to paginating the commit list.
+    """
+    response = await client.get(f"/repos/{owner}/{repo}/compare/{base_sha}...HEAD")
+    if response.status_code == 404:
+        return None
+    _check_response(response)
+    data = response.json()
+    commits = data.get("commits", [])
+    if data.get("total_commits", len(commits)) > len(commits):
+        return None
+    return commits
+
+def _commit_contents(commit: dict) -> dict:
+    """
+    Builds bundle contents from a REST commit object. Dates are passed through as the
+    ISO-8601 strings GitHub already sends, so no datetime parsing or formatting happens here.
+    """
+    commit_info = commit["commit"]
+    author = commit_info.get("author") or {}
+    committer = commit_info.get("committer") or {}
+    return {
+        "sha": commit["sha"],
+        "message": commit_info.get("message"),
+        "author_name": author.get("name"),
+        "author_email": author.get("email"),
+        "author_date": author.get("date"),
+        "committer_name": committer.get("name"),
+        "committer_email": committer.get("email"),
+        "committer_date": committer.get("date"),
+        "html_url": commit.get("html_url"),
+        "parents": [p["sha"] for p in commit.get("parents", [])] # List of parent SHAs
+    }
+
+async def _backfill_one(
+    client: httpx.AsyncClient,
+    repo_full_name: str,
+    last_sha_for_repo: str | None,
+    last_pushed_at_for_repo: str | None
+) -> tuple[str, str | None, str | None]:
+    """
+    Backfill a single repository: fetch commits newer than last_sha_for_repo,
+    bundle them oldest-to-newest as NEW, and return
+    (repo_full_name, newest SHA processed, repo pushed_at). Repos whose pushed_at
+    is unchanged since the last backfill are skipped without listing commits.
+    Only RateLimitExceeded propagates; other errors are logged and the repo is skipped.
+    """
+    try:
+        owner, repo_name_only = _resolve_repo(repo_full_name)
+
+        pushed_at = await _fetch_pushed_at(client, owner, repo_name_only)
+        if last_pushed_at_for_repo and pushed_at == last_pushed_at_for_repo:
+            logger.info(f"No pushes to {repo_full_name} since last backfill ({pushed_at}). Skipping.")
+            return repo_full_name, None, pushed_at
+
+        logger.info(f"Backfilling repository: {repo_full_name} since SHA: {last_sha_for_repo or 'beginning'}")
+
+        commits_to_process: list[dict] | None = None
+        if last_sha_for_repo:
+            # Known starting point: fetch only the delta (already oldest → newest)
+            commits_to_process = await _compare_commits(client, owner, repo_name_only, last_sha_for_repo)
+            if commits_to_process is None:
+                logger.info(f"Compare from {last_sha_for_repo} unavailable for {repo_full_name}. Falling back to paginated fetch.")
+
+        if commits_to_process is None:
+            commits_to_process = []
+            logger.debug(f"Fetching commits for {repo_full_name}...")
+            async for commit in _fetch_commits(client, owner, repo_name_only, last_sha_for_repo):
+                commits_to_process.append(commit)
+                if len(commits_to_process) % COMMITS_PER_PAGE == 0:
+                    logger.debug(f"Fetched {len(commits_to_process)} commits for {repo_full_name} so far...")
+            # Listing is newest-first; process oldest → newest
+            commits_to_process.reverse()
+
+        logger.info(f"Found {len(commits_to_process)} new commits in {repo_full_name} to backfill.")
+
+    except RateLimitExceeded:
+        raise
+    except httpx.HTTPError as e:
+        logger.error(f"GitHub API error for repository {repo_full_name}: {e}. Skipping this repo.")
+        return repo_full_name, None, None
+    except Exception as e:
+        logger.error(f"Unexpected error backfilling repository {repo_full_name}: {e}", exc_info=True)
+        return repo_full_name, None, None
+
+    bundles = []
+    newest_sha_processed_in_repo = None
+    for commit in commits_to_process:
+        try:
+            rid = GithubCommit(owner=owner, repo=repo_name_only, sha=commit["sha"])
+            bundles.append(Bundle.generate(rid=rid, contents=_commit_contents(commit)))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Bundling backfill commit {rid}")
+
+            # Track the newest SHA processed in this run for this repo
+            newest_sha_processed_in_repo = commit["sha"]
+
+        except Exception as e:
+            logger.error(f"Error processing commit {commit.get('sha')} in {repo_full_name}: {e}", exc_info=True)
+
+    # Queue the whole repo's commits in one batch, preserving oldest → newest order
+    try:
+        handle_bundles(bundles)
+    except Exception as e:
+        # Don't record a SHA for commits that never reached the processor, and keep
+        # the failure from cancelling the other repos' backfills
+        logger.error(f"Error handling backfill commits for {repo_full_name}: {e}", exc_info=True)
+        return repo_full_name, None, None
+
+    if newest_sha_processed_in_repo:
+        logger.debug(f"Newest SHA processed for {repo_full_name} in this run: {newest_sha_processed_in_repo}")
+    return repo_full_name, newest_sha_processed_in_repo, pushed_at
+
+async def _backfill_all(current_state: dict, current_pushed_at: dict) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Backfills every monitored repo concurrently over one shared HTTP/2 connection.
+    Returns maps of repo -> newest SHA processed and repo -> pushed_at observed.
+    On the first RateLimitExceeded the remaining repos are cancelled and the exception is re-raised.
+    """
+    # Every commit field (parents included) comes from the page JSON, so the request
+    # count should equal the pages and compare/repo lookups issued, not scale with commits
+    requests_made = 0
+    async def _count_request(request: httpx.Request):
+        nonlocal requests_made
+        requests_made += 1
+
+    async with _make_client() as client:
+        client.event_hooks = {"request": [_count_request]}
+        tasks = [
+            asyncio.create_task(_backfill_one(
+                client, repo_full_name,
+                current_state.get(repo_full_name), current_pushed_at.get(repo_full_name)
+            ))
+            for repo_full_name in MONITORED_REPOS
+        ]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            if task.exception():
+                raise task.exception()
+    logger.info(f"Backfill made {requests_made} GitHub API request(s).")
+
+    results = [task.result() for task in tasks]
+    newest_shas = {repo_full_name: newest_sha for repo_full_name, newest_sha, _ in results if newest_sha}
+    pushed_ats = {repo_full_name: pushed_at for repo_full_name, _, pushed_at in results if pushed_at}
+    return newest_shas, pushed_ats
 
 def perform_backfill():
     """
     One-time startup backfill: fetch all commits since LAST_PROCESSED_SHA
     for each monitored repo, bundle them as NEW, and persist the latest SHA processed.
-    Processes commits oldest-to-newest after fetching.
+    Repos are fetched concurrently via the GitHub REST API;
+    within a repo, commits are processed oldest-to-newest after fetching.
     """
     logger.info("Starting GitHub backfill process...")
-    
-    # Load the state dictionary once before the loop
+
+    # Load the state dictionary once before dispatching
     current_state = LAST_PROCESSED_SHA.copy() # Use a copy to avoid modifying during iteration if needed
-    newest_sha_processed_overall_map = {} # Track newest SHA per repo processed in this run
+    current_pushed_at = LAST_PUSHED_AT.copy()
 
     if not MONITORED_REPOS:
         logger.warning("No repositories configured in MONITORED_REPOS. Backfill skipped.")
         return
 
-    for repo_full_name in MONITORED_REPOS:
-        try:
-            owner, repo_name_only = repo_full_name.split('/')
-            # Get the last processed SHA for *this specific repository*
-            last_sha_for_repo = current_state.get(repo_full_name)
-            logger.info(f"Backfilling repository: {repo_full_name} since SHA: {last_sha_for_repo or 'beginning'}")
-
-            gh_repo = github_client.get_repo(repo_full_name)
-            commits_to_process_buffer: list[Commit] = []
-            
-            # Iterate commits newest-first until we find the last processed one
-            paginated_commits = gh_repo.get_commits()
-            logger.debug(f"Fetching commits for {repo_full_name}...")
-            commit_count = 0
-            for commit in paginated_commits:
-                commit_count += 1
-                # Check against the specific SHA for this repo
-                if last_sha_for_repo and commit.sha == last_sha_for_repo:
-                    logger.info(f"Found last processed SHA {last_sha_for_repo} in {repo_full_name}. Stopping fetch for this repo.")
-                    break
-                commits_to_process_buffer.append(commit)
-                # Safety break for potentially huge repos without a known SHA
-                # Adjust limit as needed
-                if commit_count % 100 == 0:
-                    logger.debug(f"Fetched {commit_count} commits for {repo_full_name} so far...")
-                # if commit_count > 1000: 
-                #    logger.warning(f"Reached fetch limit (1000) for {repo_full_name}. Consider adjusting.")
-                #    break 
-            
-            logger.info(f"Found {len(commits_to_process_buffer)} new commits in {repo_full_name} to backfill.")
-
-            # Process commits oldest → newest
-            newest_sha_processed_in_repo = None
-            for commit in reversed(commits_to_process_buffer):
-                try:
-                    rid = GithubCommit(owner=owner, repo=repo_name_only, sha=commit.sha)
-                    # Extract commit details carefully, handling potential missing attributes
-                    author = commit.commit.author
-                    committer = commit.commit.committer
-                    
-                    contents = {
-                        "sha": commit.sha,
-                        "message": commit.commit.message,
-                        "author_name": author.name if author else None,
-                        "author_email": author.email if author else None,
-                        "author_date": author.date.isoformat() if author and author.date else None,
-                        "committer_name": committer.name if committer else None,
-                        "committer_email": committer.email if committer else None,
-                        "committer_date": committer.date.isoformat() if committer and committer.date else None,
-                        "html_url": commit.html_url,
-                        "parents": [p.sha for p in commit.parents] # List of parent SHAs
-                    }
-                    bundle = Bundle.generate(rid=rid, contents=contents)
-                    logger.debug(f"Bundling backfill commit {rid}")
-                    node.processor.handle(bundle=bundle) 
-                    
-                    # Track the newest SHA processed in this run for this repo
-                    newest_sha_processed_in_repo = commit.sha 
-                    
-                except Exception as e:
-                    logger.error(f"Error processing commit {commit.sha} in {repo_full_name}: {e}", exc_info=True)
-
-            # Store the newest SHA processed for this repo during this run
-            if newest_sha_processed_in_repo:
-                newest_sha_processed_overall_map[repo_full_name] = newest_sha_processed_in_repo
-                logger.debug(f"Newest SHA processed for {repo_full_name} in this run: {newest_sha_processed_in_repo}")
-
-        except RateLimitExceededException:
-            logger.error(f"GitHub API rate limit exceeded while backfilling {repo_full_name}. Aborting backfill. Try again later or use a GITHUB_TOKEN.")
-            # Depending on requirements, could wait and retry, but for now, we stop.
-            return # Stop the entire backfill process
-        except GithubException as e:
-            logger.error(f"GitHub API error for repository {repo_full_name}: {e}. Skipping this repo.")
-            continue # Skip to the next repository
-        except Exception as e:
-            logger.error(f"Unexpected error backfilling repository {repo_full_name}: {e}", exc_info=True)
-            continue # Skip to the next repository
-
-    # After processing all repos, persist the newest SHAs found (if changed)
-    updated_count = 0
-    for repo_full_name, newest_sha in newest_sha_processed_overall_map.items():
-        if newest_sha != current_state.get(repo_full_name):
-            update_state_file(repo_full_name, newest_sha) # Call function from config.py
-            updated_count += 1
-        else:
-            logger.debug(f"No state update needed for {repo_full_name}, newest SHA {newest_sha} is same as stored.")
-            
-    if updated_count > 0:
-        logger.info(f"Backfill complete. Updated state for {updated_count} repositories.")
+    try:
+        newest_sha_processed_overall_map, pushed_at_map = asyncio.run(_backfill_all(current_state, current_pushed_at))
+    except RateLimitExceeded as e:
+        logger.error(f"GitHub API rate limit exceeded during backfill: {e}. Aborting backfill. Try again later or use a GITHUB_TOKEN.")
+        # Depending on requirements, could wait and retry, but for now, we stop.
+        return # Stop the entire backfill process
+
+    # After processing all repos, persist the newest SHAs and pushed_at values found (if changed) in one write
+    changed = {
+        repo_full_name: newest_sha
+        for repo_full_name, newest_sha in newest_sha_processed_overall_map.items()
+        if newest_sha != current_state.get(repo_full_name)
+    }
+    changed_pushed_at = {
+        repo_full_name: pushed_at
+        for repo_full_name, pushed_at in pushed_at_map.items()
+        if pushed_at != current_pushed_at.get(repo_full_name)
+    }
+    update_state_bulk(changed, changed_pushed_at)
+
+    if changed:
+        logger.info(f"Backfill complete. Updated state for {len(changed)} repositories.")
     else:
         logger.info(f"Backfill complete. No new commits found or state changes required across monitored repositories.")
 
@@ -132,4 +283,4 @@ if __name__ == "__main__":
     logger.info("Running backfill directly for testing...")
     # node.start() # Might be needed depending on node.processor.handle implementation
     perform_backfill()
-    # node.stop() 
+    # node.stop()
@@ -1,6 +1,9 @@
 import logging
-import json
-from pydantic_settings import BaseSettings
+import os
+import threading
+import orjson
+from functools import cached_property
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from typing import Optional, List
 
@@ -9,6 +12,13 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 logger = logging.getLogger(__name__)
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file='services/github/.env',
+        env_file_encoding='utf-8',
+        extra='ignore',
+        frozen=True # Settings never change after load
+    )
+
     # --- KOI-net Configuration ---
     URL: str = Field(..., description="Public URL where this Github node can be reached by other KOI-net nodes.")
     FIRST_CONTACT: str = Field(..., description="URL of the coordinator node or another known KOI-net node.")
@@ -29,9 +39,9 @@ class Settings(BaseSettings):
     # --- Logging Configuration ---
     LOG_LEVEL: str = Field(default="INFO", description="Logging level (e.g., DEBUG, INFO, WARNING).")
 
-    @property
+    @cached_property
     def MONITORED_REPOS(self) -> List[str]:
-        """Parses the comma-separated MONITORED_REPOS_STR into a list of 'owner/repo' strings."""
+        """Parses the comma-separated MONITORED_REPOS_STR into a list of 'owner/repo' strings (once per instance)."""
         if not self.MONITORED_REPOS_STR:
             return []
         # Split by comma, strip whitespace, and filter out empty strings
@@ -39,11 +49,6 @@ class Settings(BaseSettings):
         logger.debug(f"Parsed monitored repos: {repos}")
         return repos
 
-    class Config:
-        env_file = 'services/github/.env'
-        env_file_encoding = 'utf-8'
-        extra = 'ignore'
-
 # Instantiate settings early to catch config errors on import
 try:
     settings = Settings()
@@ -64,45 +69,119 @@ HOST = settings.HOST
 PORT = settings.PORT
 GITHUB_TOKEN = settings.GITHUB_TOKEN
 GITHUB_WEBHOOK_SECRET = settings.GITHUB_WEBHOOK_SECRET
-MONITORED_REPOS = settings.MONITORED_REPOS # Access the parsed list via the property
+MONITORED_REPOS = frozenset(settings.MONITORED_REPOS) # Parsed once; immutable with O(1) membership checks
 STATE_FILE_PATH = settings.STATE_FILE_PATH
 LOG_LEVEL = settings.LOG_LEVEL
 
 # --- State Management (Loading initial state & update function) ---
+# On disk the state file maps repo_name -> {"sha": ..., "pushed_at": ...};
+# in memory the two fields are kept as separate dictionaries.
 LAST_PROCESSED_SHA = {} # Dictionary mapping repo_name -> last_sha
+LAST_PUSHED_AT = {} # Dictionary mapping repo_name -> repo pushed_at seen at the last backfill
+_state_loaded = False # Set once load_state() has run, so later calls are no-ops
+_pending_state = {} # repo_name -> sha updates not yet written, see schedule_state_update()
+_pending_state_lock = threading.Lock()
+_state_write_lock = threading.Lock() # Serializes writers of the shared temp file
+
+def _split_state(state: dict) -> tuple[dict, dict]:
+    """Splits the on-disk state into SHA and pushed_at maps, accepting the older {repo: sha} format."""
+    shas, pushed_at = {}, {}
+    for repo_name, entry in state.items():
+        if isinstance(entry, dict):
+            if entry.get("sha"):
+                shas[repo_name] = entry["sha"]
+            if entry.get("pushed_at"):
+                pushed_at[repo_name] = entry["pushed_at"]
+        else:
+            shas[repo_name] = entry
+    return shas, pushed_at
 
 def load_state():
-    """Loads the last processed SHA state from the JSON file."""
-    global LAST_PROCESSED_SHA
+    """Loads the last processed SHA (and pushed_at) state from the JSON file, once per process."""
+    global LAST_PROCESSED_SHA, LAST_PUSHED_AT, _state_loaded
+    if _state_loaded:
+        return
+    _state_loaded = True
     try:
-        with open(STATE_FILE_PATH, 'r') as f:
-            LAST_PROCESSED_SHA = json.load(f)
+        with open(STATE_FILE_PATH, 'rb') as f:
+            LAST_PROCESSED_SHA, LAST_PUSHED_AT = _split_state(orjson.loads(f.read()))
         logger.info(f"Loaded state from '{STATE_FILE_PATH}': {list(LAST_PROCESSED_SHA.keys())}")
     except FileNotFoundError:
         logger.warning(f"State file '{STATE_FILE_PATH}' not found. Starting with empty state.")
-        LAST_PROCESSED_SHA = {}
-    except json.JSONDecodeError:
+        LAST_PROCESSED_SHA, LAST_PUSHED_AT = {}, {}
+    except orjson.JSONDecodeError:
         logger.error(f"Error decoding JSON from state file '{STATE_FILE_PATH}'. Starting with empty state.")
-        LAST_PROCESSED_SHA = {}
+        LAST_PROCESSED_SHA, LAST_PUSHED_AT = {}, {}
     except Exception as e:
         logger.error(f"Unexpected error loading state file '{STATE_FILE_PATH}': {e}", exc_info=True)
-        LAST_PROCESSED_SHA = {}
+        LAST_PROCESSED_SHA, LAST_PUSHED_AT = {}, {}
+
+def _write_state_file():
+    """
+    Writes the state to the state file durably: compact JSON in a single write
+    to a temp file, fsync, then os.replace so readers never see a partial file.
+    """
+    # Create directory if it doesn't exist (though it should usually be just the filename)
+    # os.makedirs(os.path.dirname(STATE_FILE_PATH), exist_ok=True) # Uncomment if path can include dirs
+    tmp_path = STATE_FILE_PATH + ".tmp"
+    with _state_write_lock:
+        # Snapshot under the lock, so a writer holding an older snapshot can never
+        # replace a newer file written by another thread
+        state = {
+            repo_name: {"sha": LAST_PROCESSED_SHA.get(repo_name), "pushed_at": LAST_PUSHED_AT.get(repo_name)}
+            for repo_name in dict.fromkeys([*LAST_PROCESSED_SHA, *LAST_PUSHED_AT])
+        }
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, orjson.dumps(state))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, STATE_FILE_PATH)
 
 def update_state_file(repo_name: str, last_sha: str):
     """Updates the state file with the latest processed SHA for a repo."""
     global LAST_PROCESSED_SHA
     LAST_PROCESSED_SHA[repo_name] = last_sha
     try:
-        # Create directory if it doesn't exist (though it should usually be just the filename)
-        # import os
-        # os.makedirs(os.path.dirname(STATE_FILE_PATH), exist_ok=True) # Uncomment if path can include dirs
-        with open(STATE_FILE_PATH, 'w') as f:
-            json.dump(LAST_PROCESSED_SHA, f, indent=4)
+        _write_state_file()
         logger.debug(f"Updated state file '{STATE_FILE_PATH}' for {repo_name} with SHA: {last_sha}")
     except IOError as e:
         logger.error(f"Failed to write state file '{STATE_FILE_PATH}': {e}")
     except Exception as e:
         logger.error(f"Unexpected error writing state file '{STATE_FILE_PATH}': {e}", exc_info=True)
 
+def update_state_bulk(updates: dict[str, str], pushed_at: dict[str, str] | None = None):
+    """Updates the latest processed SHA (and optionally pushed_at) for several repos, writing the state file once."""
+    if not updates and not pushed_at:
+        return
+    LAST_PROCESSED_SHA.update(updates)
+    LAST_PUSHED_AT.update(pushed_at or {})
+    try:
+        _write_state_file()
+        logger.debug(f"Updated state file '{STATE_FILE_PATH}' for {list(dict.fromkeys([*updates, *(pushed_at or {})]))}")
+    except IOError as e:
+        logger.error(f"Failed to write state file '{STATE_FILE_PATH}': {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error writing state file '{STATE_FILE_PATH}': {e}", exc_info=True)
+
+def schedule_state_update(repo_name: str, last_sha: str):
+    """
+    Records the latest processed SHA for a repo without touching the disk. The in-memory
+    state is updated immediately; the file is written by the next flush_pending_state().
+    """
+    with _pending_state_lock:
+        LAST_PROCESSED_SHA[repo_name] = last_sha
+        _pending_state[repo_name] = last_sha
+
+def flush_pending_state():
+    """Writes all SHA updates recorded by schedule_state_update() in a single state file write."""
+    global _pending_state
+    with _pending_state_lock:
+        if not _pending_state:
+            return
+        updates, _pending_state = _pending_state, {}
+    update_state_bulk(updates)
+
 # Load initial state when config module is imported
 load_state()
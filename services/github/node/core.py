@@ -1,8 +1,16 @@
 import os
+import queue
 import shutil
 import logging
+import threading
+from typing import Callable, Hashable
 
+from cachetools import TTLCache
+
+from rid_lib.ext import Bundle
 from koi_net import NodeInterface
+from koi_net.processor.knowledge_object import KnowledgeObject, KnowledgeSource
+from koi_net.protocol.event import Event
 from koi_net.protocol.node import NodeProfile, NodeType, NodeProvides
 
 from .config import HOST, PORT, FIRST_CONTACT
@@ -14,11 +22,12 @@ name = "sensor"
 
 identity_dir = f".koi/{name}"
 cache_dir = f".koi/{name}/rid_cache_{name}"
-# Remove existing directories if they exist
-shutil.rmtree(identity_dir, ignore_errors=True)
-shutil.rmtree(cache_dir, ignore_errors=True)
+# Start from a clean slate only when asked; by default reuse the warm cache across restarts
+if os.environ.get("KOI_WIPE_CACHE") == "1":
+    shutil.rmtree(identity_dir, ignore_errors=True)
+    shutil.rmtree(cache_dir, ignore_errors=True)
 
-# Recreate the directories
+# Create the directories if they don't exist yet
 os.makedirs(identity_dir, exist_ok=True)
 os.makedirs(cache_dir, exist_ok=True)
 
@@ -42,3 +51,58 @@ node = NodeInterface(
 
 logger.info(f"Initialized NodeInterface: {node.identity.rid}")
 logger.info(f"Node attempting first contact with: {FIRST_CONTACT}")
+
+# Short-lived cache of fetch_rids/fetch_manifests payloads, so peers polling the same
+# query in quick succession skip the cache read. Cleared by the invalidate_fetch_cache Final
+# handler once the processor has written to the RID cache.
+_fetch_cache = TTLCache(maxsize=256, ttl=2.0)
+_fetch_cache_lock = threading.Lock()
+
+def cached_fetch(key: Hashable, fetch: Callable):
+    """Returns the cached payload for key, calling fetch() and caching its result on a miss."""
+    with _fetch_cache_lock:
+        payload = _fetch_cache.get(key)
+    if payload is None:
+        payload = fetch()
+        with _fetch_cache_lock:
+            _fetch_cache[key] = payload
+    return payload
+
+def clear_fetch_cache():
+    """Drops all cached fetch payloads; called after the processor changes the RID cache."""
+    with _fetch_cache_lock:
+        _fetch_cache.clear()
+
+def _queue_kobjs(kobjs: list[KnowledgeObject]) -> bool:
+    """
+    Adds knowledge objects to the processor queue under a single lock acquisition.
+    Returns False if the processor queue isn't a queue.Queue, leaving it to the caller.
+    """
+    kobj_queue = getattr(node.processor, "kobj_queue", None)
+    if not isinstance(kobj_queue, queue.Queue):
+        return False
+    # Mirrors queue.Queue.put() for an unbounded queue, batched under a single lock
+    with kobj_queue.mutex:
+        kobj_queue.queue.extend(kobjs)
+        kobj_queue.unfinished_tasks += len(kobjs)
+        kobj_queue.not_empty.notify(len(kobjs))
+    return True
+
+def handle_bundles(bundles: list[Bundle]):
+    """
+    Queues several bundles for processing in one step. Takes the processor queue's
+    lock once for the whole batch instead of once per `node.processor.handle()` call.
+    """
+    if not bundles:
+        return
+    if not _queue_kobjs([KnowledgeObject.from_bundle(bundle) for bundle in bundles]):
+        for bundle in bundles:
+            node.processor.handle(bundle=bundle)
+
+def handle_events(events: list[Event], source: KnowledgeSource = KnowledgeSource.External):
+    """Queues several events from the same source for processing in one step, like handle_bundles()."""
+    if not events:
+        return
+    if not _queue_kobjs([KnowledgeObject.from_event(event, source) for event in events]):
+        for event in events:
+            node.processor.handle(event=event, source=source)
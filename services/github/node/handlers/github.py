@@ -1,7 +1,7 @@
 import logging
 from rid_lib.ext import Bundle
 # Assuming GithubCommit RID type is accessible
-from ..core import node # Import the initialized node instance
+from ..core import node, clear_fetch_cache # Import the initialized node instance
 from ..types import GithubCommit # Ensure this import is correct
 
 # Imports needed for coordinator_contact handler from refactor.md
@@ -60,12 +60,23 @@ def coordinator_contact(processor: ProcessorInterface, kobj: KnowledgeObject):
              return
              
         logger.debug(f"Received {len(payload.rids)} RIDs from {kobj.rid}")
-        for rid in payload.rids:
-            # Don't process self or already known nodes
-            if rid == processor.identity.rid or processor.cache.exists(rid):
-                continue
+        # Don't process self or already known nodes
+        todo = [
+            rid for rid in payload.rids
+            if rid != processor.identity.rid and not processor.cache.exists(rid)
+        ]
+        if not todo:
+            return
+
+        # Fetch all unknown node bundles in one request rather than dereferencing each RID separately
+        logger.debug(f"Fetching {len(todo)} discovered node bundle(s) from {kobj.rid}")
+        bundles_payload = processor.network.request_handler.fetch_bundles(kobj.rid, rids=todo)
+        for bundle in bundles_payload.bundles:
+            processor.handle(bundle=bundle, source=KnowledgeSource.External)
+
+        # Anything the peer couldn't serve falls back to handling the bare RID (profile fetched later)
+        for rid in bundles_payload.not_found + bundles_payload.deferred:
             logger.debug(f"Handling discovered RID from sync: {rid}")
-            # Handle the RID to fetch its details (profile, etc.)
             processor.handle(rid=rid, source=KnowledgeSource.External)
     except Exception as e:
         logger.error(f"Failed during network sync with {kobj.rid}: {e}", exc_info=True)
@@ -133,4 +144,14 @@ def propose_github_commit_edge_to_coordinator(processor: ProcessorInterface, kob
         except Exception as e:
             logger.error(f"Failed to generate/handle GithubCommit edge bundle for {kobj.rid}: {e}", exc_info=True)
 
+@node.processor.register_handler(HandlerType.Final)
+def invalidate_fetch_cache(processor: ProcessorInterface, kobj: KnowledgeObject):
+    """
+    Drops the short-lived fetch_rids/fetch_manifests payload cache once a knowledge object
+    has been written to (or deleted from) the RID cache. The Final chain only runs after
+    that write, so a fetch arriving earlier can't re-cache a stale payload past it.
+    """
+    clear_fetch_cache()
+    return None
+
 logger.info("GithubCommit Bundle handler and KoiNetNode handlers registered.")
@@ -0,0 +1,48 @@
+import asyncio
+import logging
+from fastapi import FastAPI, HTTPException
+from .core import handle_bundles, handle_events
+from .config import schedule_state_update
+
+logger = logging.getLogger(__name__)
+
+INGEST_QUEUE_SIZE = 10_000 # Items held before endpoints start answering 503
+INGEST_DRAIN_TIMEOUT = 10.0 # Seconds shutdown waits for queued items to reach the processor
+
+async def drain_ingest_queue(ingest_queue: asyncio.Queue):
+    """
+    Consumes (kind, payload, state_update) items from the ingest queue, where kind is
+    "events" or "bundles" and payload is a list queued as one batch, and hands each to the
+    processor in a worker thread so the event loop is never blocked. Run exactly one
+    consumer: items are handed over one at a time, in queue order, so a later push or
+    FORGET never overtakes an earlier one. A state_update (repo, sha) pair is recorded
+    only once its payload has reached the processor.
+    """
+    while True:
+        kind, payload, state_update = await ingest_queue.get()
+        try:
+            if kind == "events":
+                await asyncio.to_thread(handle_events, payload)
+            else:
+                await asyncio.to_thread(handle_bundles, payload)
+            if state_update:
+                schedule_state_update(*state_update)
+        except Exception as e:
+            logger.error("Error handling queued %s: %s", kind, e, exc_info=True)
+        finally:
+            ingest_queue.task_done()
+
+def enqueue_ingest(app: FastAPI, kind: str, payloads: list, state_update: tuple[str, str] | None = None):
+    """
+    Queues payloads of one kind for the ingest consumer without waiting.
+    Raises HTTPException(503) if the queue can't take all of them, so a request is
+    either queued in full or not at all. An optional (repo, sha) state_update rides with
+    the last payload, so the SHA isn't persisted for a push that never got processed.
+    """
+    ingest_queue: asyncio.Queue = app.state.ingest_queue
+    if ingest_queue.maxsize and ingest_queue.maxsize - ingest_queue.qsize() < len(payloads):
+        logger.warning("Ingest queue full (%d items). Rejecting %d %s(s).", ingest_queue.qsize(), len(payloads), kind)
+        raise HTTPException(status_code=503, detail="Ingest queue full, retry later")
+    last = len(payloads) - 1
+    for i, payload in enumerate(payloads):
+        ingest_queue.put_nowait((kind, payload, state_update if i == last else None))
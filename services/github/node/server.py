@@ -1,8 +1,9 @@
 import logging
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, APIRouter, Request, Body, Header, HTTPException
-from koi_net.processor.knowledge_object import KnowledgeSource
+from fastapi.middleware.gzip import GZipMiddleware
 from koi_net.protocol.api_models import (
     PollEvents,
     FetchRids,
@@ -20,13 +21,26 @@ from koi_net.protocol.consts import (
     FETCH_MANIFESTS_PATH,
     FETCH_BUNDLES_PATH
 )
-from .core import node
+from .core import node, cached_fetch
 from .webhook import router as github_router
 from .backfill import perform_backfill
+from .ingest import INGEST_QUEUE_SIZE, INGEST_DRAIN_TIMEOUT, drain_ingest_queue, enqueue_ingest
 from .loader import register_handlers
+from .config import flush_pending_state
 
 logger = logging.getLogger(__name__)
 
+STATE_FLUSH_INTERVAL = 1.0 # Seconds between writes of webhook state updates
+
+async def _flush_state_periodically():
+    """Writes pending webhook state updates at most once per interval, off the event loop."""
+    while True:
+        await asyncio.sleep(STATE_FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(flush_pending_state)
+        except Exception as e:
+            logger.error("Error flushing state file: %s", e, exc_info=True)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage node startup, backfill, and shutdown."""
@@ -41,12 +55,21 @@ async def lifespan(app: FastAPI):
         # Depending on requirements, you might want to prevent the app from starting
         raise RuntimeError("Failed to initialize KOI-net node") from e
 
+    # Start the consumer that hands webhook/broadcast payloads to the processor. A single
+    # consumer keeps payloads and their state updates in the order they were queued.
+    app.state.ingest_queue = asyncio.Queue(maxsize=INGEST_QUEUE_SIZE)
+    ingest_task = asyncio.create_task(drain_ingest_queue(app.state.ingest_queue))
+
+    # Coalesce webhook state updates into at most one state file write per interval
+    state_flush_task = asyncio.create_task(_flush_state_periodically())
+
     # Run initial backfill in the background
     logger.info("Scheduling initial GitHub backfill...")
-    # Run backfill in a separate thread/task to avoid blocking startup
-    # Note: perform_backfill itself is synchronous, so asyncio.to_thread is suitable.
-    # If perform_backfill becomes async, just use asyncio.create_task directly.
-    backfill_task = asyncio.to_thread(perform_backfill)
+    # perform_backfill is synchronous, so it runs on its own single-thread executor.
+    # Its repos are fetched concurrently on an event loop inside that thread, so one worker
+    # is enough, and it never takes a slot from the default pool used by asyncio.to_thread.
+    backfill_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backfill")
+    backfill_task = asyncio.get_running_loop().run_in_executor(backfill_executor, perform_backfill)
     # If you need to wait for backfill completion before yielding, await here.
     # For now, let it run in the background.
 
@@ -55,17 +78,30 @@ async def lifespan(app: FastAPI):
     finally:
         # Cleanup: Cancel pending tasks, stop the node
         logger.info("Shutting down FastAPI application...")
-        # Attempt to gracefully cancel the backfill if it's still running
-        # This might require more sophisticated task management if backfill is long-running
-        # if backfill_task and not backfill_task.done():
-        #     try:
-        #         backfill_task.cancel()
-        #         await backfill_task
-        #     except asyncio.CancelledError:
-        #         logger.info("Backfill task cancelled.")
-        #     except Exception as e:
-        #         logger.error(f"Error cancelling backfill task: {e}", exc_info=True)
-        
+        # Hand everything already acknowledged with 202 to the processor before stopping the
+        # consumer; node.stop() below then joins the processor's own queue
+        try:
+            await asyncio.wait_for(app.state.ingest_queue.join(), INGEST_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            # Their state updates were never recorded, so the final flush won't mark them done
+            logger.warning(
+                "Ingest queue not drained within %.0fs; dropping %d queued item(s).",
+                INGEST_DRAIN_TIMEOUT, app.state.ingest_queue.qsize()
+            )
+        ingest_task.cancel()
+        await asyncio.gather(ingest_task, return_exceptions=True)
+        state_flush_task.cancel()
+        await asyncio.gather(state_flush_task, return_exceptions=True)
+        # Final flush so updates from the last interval aren't lost
+        try:
+            flush_pending_state()
+        except Exception as e:
+            logger.error("Error flushing state file on shutdown: %s", e, exc_info=True)
+        # A backfill still running is left to finish on its thread; the loop doesn't wait for it
+        if not backfill_task.done():
+            logger.info("Backfill still running at shutdown; not waiting for it.")
+        backfill_executor.shutdown(wait=False, cancel_futures=True)
+
         try:
             node.stop()
             logger.info("KOI-net node stopped successfully.")
@@ -80,39 +116,51 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan # Register the lifespan context manager
 )
+# Compress large responses (mostly fetch manifests/bundles) for peers that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Define KOI-net API router
 koi_net_router = APIRouter(prefix="/koi-net")
 
-@koi_net_router.post(BROADCAST_EVENTS_PATH)
-async def broadcast_events_endpoint(req: EventsPayload):
-    logger.info(f"Request to {BROADCAST_EVENTS_PATH}, received {len(req.events)} event(s)")
-    for event in req.events:
-        node.processor.handle(event=event, source=KnowledgeSource.External)
+@koi_net_router.post(BROADCAST_EVENTS_PATH, status_code=202)
+async def broadcast_events_endpoint(req: EventsPayload, request: Request):
+    logger.info("Request to %s, received %d event(s)", BROADCAST_EVENTS_PATH, len(req.events))
+    # Queued as one batch for the ingest consumer; answers 503 if the queue is full
+    if req.events:
+        enqueue_ingest(request.app, "events", [req.events])
     return {} # Broadcast endpoint typically returns empty success
 
 @koi_net_router.post(POLL_EVENTS_PATH)
 async def poll_events_endpoint(req: PollEvents) -> EventsPayload:
-    logger.info(f"Request to {POLL_EVENTS_PATH}")
+    logger.info("Request to %s", POLL_EVENTS_PATH)
     events = node.network.flush_poll_queue(req.rid)
     return EventsPayload(events=events)
 
+# The fetch endpoints read the RID cache synchronously, so they are plain `def` and run in
+# Starlette's threadpool rather than blocking the event loop
 @koi_net_router.post(FETCH_RIDS_PATH)
-async def fetch_rids_endpoint(req: FetchRids) -> RidsPayload:
-    logger.info(f"Request to {FETCH_RIDS_PATH} for types {req.rid_types}")
-    # The default response_handler reads from cache, fulfilling the provides=[GithubCommit] state
-    return node.network.response_handler.fetch_rids(req)
+def fetch_rids_endpoint(req: FetchRids) -> RidsPayload:
+    logger.info("Request to %s for types %s", FETCH_RIDS_PATH, req.rid_types)
+    # The default response_handler reads from cache, fulfilling the provides=[GithubCommit] state.
+    # Identical queries within a couple of seconds are answered from memory.
+    return cached_fetch(
+        (FETCH_RIDS_PATH, frozenset(req.rid_types or ())),
+        lambda: node.network.response_handler.fetch_rids(req)
+    )
 
 @koi_net_router.post(FETCH_MANIFESTS_PATH)
-async def fetch_manifests_endpoint(req: FetchManifests) -> ManifestsPayload:
-    logger.info(f"Request to {FETCH_MANIFESTS_PATH} for types {req.rid_types}, rids {req.rids}")
-    manifests_payload = node.network.response_handler.fetch_manifests(req)
+def fetch_manifests_endpoint(req: FetchManifests) -> ManifestsPayload:
+    logger.info("Request to %s for types %s, rids %s", FETCH_MANIFESTS_PATH, req.rid_types, req.rids)
+    manifests_payload = cached_fetch(
+        (FETCH_MANIFESTS_PATH, frozenset(req.rid_types or ()), tuple(req.rids or ())),
+        lambda: node.network.response_handler.fetch_manifests(req)
+    )
     # Add any custom logic here if you need to fetch manifests not in cache
     return manifests_payload # The default handler already includes not_found
 
 @koi_net_router.post(FETCH_BUNDLES_PATH)
-async def fetch_bundles_endpoint(req: FetchBundles) -> BundlesPayload:
-    logger.info(f"Request to {FETCH_BUNDLES_PATH} for rids {req.rids}")
+def fetch_bundles_endpoint(req: FetchBundles) -> BundlesPayload:
+    logger.info("Request to %s for rids %s", FETCH_BUNDLES_PATH, req.rids)
     bundles_payload = node.network.response_handler.fetch_bundles(req)
     # Add any custom logic here if you need to fetch bundles not in cache
     return bundles_payload # The default handler already includes not_found and deferred
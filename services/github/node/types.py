@@ -1,5 +1,11 @@
+import re
 from rid_lib.core import ORN
 
+# '<owner>/<repo>/<sha>': non-empty owner and repo without '/', and a SHA of at least 7
+# characters. The SHA isn't checked for hex, since __init__ accepts any SHA and every
+# RID stored in the cache must parse back.
+_REF_RE = re.compile(r"([^/]+)/([^/]+)/(.{7,})", re.DOTALL)
+
 class GithubCommit(ORN):
     """
     Resource Identifier (RID) for a specific GitHub commit.
@@ -8,6 +14,9 @@ class GithubCommit(ORN):
     Example: orn:github.commit:microsoft/vscode/a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6q7r8s9t0
     """
     namespace = "github.commit"
+    # The ORN base still provides a __dict__, but slots make these the fast attribute path.
+    # The derived strings are built on first access and memoized.
+    __slots__ = ("owner", "repo", "sha", "_reference", "_repo_full", "_html_url", "_api_url")
 
     def __init__(self, owner: str, repo: str, sha: str):
         """
@@ -27,26 +36,38 @@ class GithubCommit(ORN):
         self.owner = owner
         self.repo = repo
         self.sha = sha
+        self._reference = None
+        self._repo_full = None
+        self._html_url = None
+        self._api_url = None
 
     @property
     def reference(self) -> str:
         """Returns the reference part of the RID: '<owner>/<repo>/<sha>'."""
-        return f"{self.owner}/{self.repo}/{self.sha}"
+        if self._reference is None:
+            self._reference = f"{self.owner}/{self.repo}/{self.sha}"
+        return self._reference
     
     @property
     def repository_full_name(self) -> str:
         """Returns the full repository name: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
+        if self._repo_full is None:
+            self._repo_full = f"{self.owner}/{self.repo}"
+        return self._repo_full
     
     @property
     def html_url(self) -> str:
         """Returns the HTML URL to view this commit on GitHub."""
-        return f"https://github.com/{self.owner}/{self.repo}/commit/{self.sha}"
+        if self._html_url is None:
+            self._html_url = f"https://github.com/{self.repository_full_name}/commit/{self.sha}"
+        return self._html_url
     
     @property
     def api_url(self) -> str:
         """Returns the GitHub API URL for this commit."""
-        return f"https://api.github.com/repos/{self.owner}/{self.repo}/commits/{self.sha}"
+        if self._api_url is None:
+            self._api_url = f"https://api.github.com/repos/{self.repository_full_name}/commits/{self.sha}"
+        return self._api_url
 
     @classmethod
     def from_reference(cls, reference: str) -> "GithubCommit":
@@ -63,22 +84,22 @@ class GithubCommit(ORN):
             ValueError: If the reference format is invalid
         """
         try:
-            parts = reference.split("/", maxsplit=2)
-            if len(parts) != 3:
-                raise ValueError("Reference must contain exactly two '/' separators")
-                
-            owner, repo, sha = parts
-            
-            if not owner or not repo or not sha:
-                raise ValueError("Owner, repo, and SHA parts cannot be empty")
-                
-            # Basic SHA length check
-            if len(sha) < 7:  # Minimum length for a short SHA
-                raise ValueError(f"SHA part seems too short: {sha}")
-                
-            return cls(owner=owner, repo=repo, sha=sha)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubCommit. Expected '<owner>/<repo>/<sha>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
+            match = _REF_RE.fullmatch(reference)
+        except TypeError as e:
             raise TypeError(f"Unexpected error parsing GithubCommit reference '{reference}': {e}") from e
+        if match is None:
+            raise ValueError(f"Invalid reference format for GithubCommit. Expected '<owner>/<repo>/<sha>' with a SHA of at least 7 characters, got '{reference}'.")
+        return cls._from_parts(*match.groups())
+
+    @classmethod
+    def _from_parts(cls, owner: str, repo: str, sha: str) -> "GithubCommit":
+        """Builds an instance from parts that are already validated, skipping __init__'s checks."""
+        obj = cls.__new__(cls)
+        obj.owner = owner
+        obj.repo = repo
+        obj.sha = sha
+        obj._reference = None
+        obj._repo_full = None
+        obj._html_url = None
+        obj._api_url = None
+        return obj
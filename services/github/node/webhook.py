@@ -1,182 +1,229 @@
 import logging
 import hmac
-import hashlib
-import json
-from fastapi import APIRouter, Request, Header, HTTPException, Body
+import re
+import orjson
+from fastapi import APIRouter, Request, Response, Header, HTTPException, Body
 from rid_lib.ext import Bundle
 from .types import GithubCommit
-from .core import node
-from .config import (
-    GITHUB_WEBHOOK_SECRET, MONITORED_REPOS,
-    update_state_file, LAST_PROCESSED_SHA 
-)
+from .ingest import enqueue_ingest
+from .config import GITHUB_WEBHOOK_SECRET, MONITORED_REPOS, LAST_PROCESSED_SHA
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-async def verify_signature(request: Request, x_hub_signature_256: str = Header(None)):
-    """Verify the GitHub webhook signature."""
-    if not GITHUB_WEBHOOK_SECRET:
+MAX_WEBHOOK_BODY_BYTES = 25 * 1024 * 1024 # GitHub caps webhook payloads at 25 MB
+# In push payloads `repository` precedes `commits`, and its `full_name` comes before any
+# nested object, so the repo can be read from the start of the body without parsing it
+_REPO_FULL_NAME_RE = re.compile(rb'"repository"\s*:\s*\{[^{}]*?"full_name"\s*:\s*"([^"]+)"')
+_REPO_PEEK_BYTES = 4096
+
+# Encoded once at import rather than on every request
+_SECRET_BYTES = GITHUB_WEBHOOK_SECRET.encode('utf-8') if GITHUB_WEBHOOK_SECRET else None
+_EXPECTED_PREFIX = "sha256="
+_EXPECTED_SIGNATURE_LEN = len(_EXPECTED_PREFIX) + 64 # Prefix plus a hex SHA-256 digest
+
+def verify_signature(body: bytes, x_hub_signature_256: str):
+    """Verify the GitHub webhook signature against the already-read request body."""
+    if not _SECRET_BYTES:
         logger.warning("Webhook verification skipped: GITHUB_WEBHOOK_SECRET not set.")
         return # Skip verification if secret is not configured
 
-    # This check is removed because FastAPI ensures the header is present
-    # if x_hub_signature_256 is None:
-    #     logger.error("Webhook verification failed: Missing X-Hub-Signature-256 header")
-    #     raise HTTPException(status_code=400, detail="Missing X-Hub-Signature-256 header")
+    # Malformed headers are rejected before any hashing
+    if (
+        len(x_hub_signature_256) != _EXPECTED_SIGNATURE_LEN
+        or not x_hub_signature_256.startswith(_EXPECTED_PREFIX)
+    ):
+        logger.error("Webhook verification failed: Malformed signature header: %s", x_hub_signature_256)
+        raise HTTPException(status_code=403, detail="Invalid signature format")
+    try:
+        # Compare raw 32-byte digests instead of hex-encoding ours
+        received_digest = bytes.fromhex(x_hub_signature_256[len(_EXPECTED_PREFIX):])
+    except ValueError:
+        logger.error("Webhook verification failed: Malformed signature header: %s", x_hub_signature_256)
+        raise HTTPException(status_code=403, detail="Invalid signature format")
 
-    body = await request.body()
-    hash_object = hmac.new(GITHUB_WEBHOOK_SECRET.encode('utf-8'), msg=body, digestmod=hashlib.sha256)
-    expected_signature = "sha256=" + hash_object.hexdigest()
+    # One-shot hmac.digest runs the whole HMAC inside OpenSSL (SHA-NI where the CPU has it)
+    expected_digest = hmac.digest(_SECRET_BYTES, body, "sha256")
 
-    if not hmac.compare_digest(expected_signature, x_hub_signature_256):
-        logger.error(f"Webhook verification failed: Invalid signature. Expected: {expected_signature}, Got: {x_hub_signature_256}")
+    if not hmac.compare_digest(expected_digest, received_digest):
+        logger.error("Webhook verification failed: Invalid signature. Got: %s", x_hub_signature_256)
         raise HTTPException(status_code=403, detail="Invalid signature")
 
     logger.debug("Webhook signature verified successfully.")
 
 
-@router.post("/github/webhook", status_code=202)  # Use 202 Accepted as we process async
+def _build_contents(commit: dict, commit_sha: str) -> dict:
+    """
+    Builds bundle contents from a webhook commit object. Each commit gets a new dict
+    since the bundle keeps a reference to the contents it is generated from.
+    """
+    get = commit.get
+    author = get("author") or {}
+    committer = get("committer") or {}
+    return {
+        "sha": commit_sha,
+        "message": get("message"),
+        "author_name": author.get("name"),
+        "author_email": author.get("email"),
+        "author_date": get("timestamp"), # GitHub often uses 'timestamp'
+        "committer_name": committer.get("name"),
+        "committer_email": committer.get("email"),
+        "committer_date": committer.get("timestamp"),
+        "html_url": get("url"), # Use 'url' from webhook payload
+        "parents": get("parents", []) # Typically a list of SHAs in webhook
+    }
+
+
+def _bundle_commit(commit: dict, repo_owner: str, repo_name: str) -> tuple[Bundle | None, Exception | None]:
+    """Bundles one webhook commit, returning (bundle, None) or (None, error) instead of raising."""
+    try:
+        rid = GithubCommit(owner=repo_owner, repo=repo_name, sha=commit["id"])
+        bundle = Bundle.generate(rid=rid, contents=_build_contents(commit, commit["id"]))
+    except Exception as e:
+        return None, e
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Bundling webhook commit %s", rid)
+    return bundle, None
+
+
+# GitHub ignores response bodies, so every outcome is acknowledged with an empty response:
+# 202 Accepted (as we process async), or 200 for 'ping'
+@router.post("/github/webhook", status_code=202, response_class=Response)
 async def github_webhook(
     request: Request,
     x_github_event: str = Header(...),  # Required header
     x_hub_signature_256: str = Header(...)  # Required for verification
 ):
     """Handle incoming GitHub webhook events (specifically 'push')."""
-    logger.info(f"Received GitHub webhook event: {x_github_event}")
+    logger.info("Received GitHub webhook event: %s", x_github_event)
 
     try:
-        # --- Signature Verification (Optional) ---
-        # await verify_signature(request, x_hub_signature_256)
+        # Reject oversized bodies before reading them
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_WEBHOOK_BODY_BYTES:
+            logger.warning("Rejecting GitHub webhook body of %s bytes", content_length)
+            raise HTTPException(status_code=413, detail="Payload too large")
 
-        # --- Parse JSON Payload ---
+        # Read the body once; it is shared by signature verification and parsing
         raw_body = await request.body()
-        try:
-            payload = json.loads(raw_body)
-        except json.JSONDecodeError:
-            logger.error("Invalid JSON in GitHub webhook payload")
-            raise HTTPException(status_code=400, detail="Invalid JSON")
+
+        # --- Signature Verification ---
+        # Skipped only when GITHUB_WEBHOOK_SECRET is unset; FastAPI already rejects a missing header
+        verify_signature(raw_body, x_hub_signature_256)
 
         # --- Event Handling ---
+        # Decided from the headers alone, before any JSON is parsed
         if x_github_event == "ping":
             logger.info("Received 'ping' event from GitHub. Responding OK.")
-            return {"message": "Pong!"}
+            return Response(status_code=200)
 
         if x_github_event != "push":
-            logger.debug(f"Ignoring non-'push' event: {x_github_event}")
-            return {"message": f"Ignoring event type: {x_github_event}"}
+            logger.debug("Ignoring non-'push' event: %s", x_github_event)
+            return Response(status_code=202)
+
+        # Skip non-monitored repos without parsing the (possibly multi-MB) payload
+        peeked = _REPO_FULL_NAME_RE.search(raw_body, 0, _REPO_PEEK_BYTES)
+        if peeked:
+            peeked_full_name = peeked.group(1).decode("utf-8", "replace")
+            if peeked_full_name not in MONITORED_REPOS:
+                logger.debug("Ignoring push event for non-monitored repository: %s", peeked_full_name)
+                return Response(status_code=202)
+
+        # --- Parse JSON Payload ---
+        try:
+            payload = orjson.loads(raw_body)
+        except orjson.JSONDecodeError:
+            logger.error("Invalid JSON in GitHub webhook payload")
+            raise HTTPException(status_code=400, detail="Invalid JSON")
 
-        logger.info(f"Processing 'push' event: {payload}")
+        # The full payload can be megabytes, so it is only rendered at DEBUG
+        logger.debug("Processing 'push' event: %s", payload)
 
         # --- Process 'push' Event ---
-        repo_info = payload.get("repository", {})
+        # Each nested dict is looked up once and bound locally
+        repo_info = payload.get("repository") or {}
+        owner_info = repo_info.get("owner") or {}
         repo_full_name = repo_info.get("full_name")
-        repo_owner = repo_info.get("owner", {}).get("login") or repo_info.get("owner", {}).get("name")
+        repo_owner = owner_info.get("login") or owner_info.get("name")
         repo_name = repo_info.get("name")
         commits = payload.get("commits", [])
-        head_commit = payload.get("head_commit", {})
+        head_commit = payload.get("head_commit") or {} # null when a branch is deleted
 
         if not repo_full_name or not repo_owner or not repo_name:
-            logger.error(f"Webhook payload missing repository details: {repo_info}")
+            logger.error("Webhook payload missing repository details: %s", repo_info)
             raise HTTPException(status_code=400, detail="Missing repository information in payload")
             
         # Check if the repository is monitored
         if repo_full_name not in MONITORED_REPOS:
-            logger.debug(f"Ignoring push event for non-monitored repository: {repo_full_name}")
-            return {"message": f"Repository {repo_full_name} not monitored"}
+            logger.debug("Ignoring push event for non-monitored repository: %s", repo_full_name)
+            return Response(status_code=202)
 
         if not commits and not head_commit:
-             logger.warning(f"'push' event for {repo_full_name} received without 'commits' or 'head_commit' data. Possibly a branch deletion or tag push? Payload head: {payload.get('ref', '')}")
-             return {"message": "No commit data found in push event"}
+             logger.warning("'push' event for %s received without 'commits' or 'head_commit' data. Possibly a branch deletion or tag push? Payload head: %s", repo_full_name, payload.get('ref', ''))
+             return Response(status_code=202)
 
-        # Determine the commit(s) to process and the SHA to potentially update state with
-        commits_to_process = []
-        sha_to_update_state = None
-        
+        # Determine the commit(s) to process and the SHA to potentially update state with.
+        # head_commit is normally also the last entry of commits, so the two are merged in
+        # one pass keyed by id; each commit is bundled once, oldest → newest.
         head_commit_id = head_commit.get('id')
-        if head_commit_id:
-            commits_to_process = [head_commit] # Use head_commit as the primary source
-            sha_to_update_state = head_commit_id # This is the SHA representing the push tip
-            logger.debug(f"Processing head_commit: {head_commit_id}")
-        elif commits:
-            commits_to_process = commits # Fallback to commits list
-            # If using commits list, the last commit's SHA is the best candidate for state update
-            if commits:
-                sha_to_update_state = commits[-1].get('id') 
-            logger.debug(f"Processing commits list (count: {len(commits)}). Potential state update SHA: {sha_to_update_state}")
-        else:
-             # This case should ideally not be reached due to the check above, but included for completeness
-             logger.warning(f"No processable commit data found in push event for {repo_full_name}. Skipping.")
-             return {"message": "No processable commit data"}
-
-        processed_new_commit = False
-        for commit in commits_to_process:
-            commit_sha = commit.get("id")
-            if not commit_sha:
-                logger.warning("Skipping commit in payload with missing 'id'.")
-                continue
-            
-            # Avoid reprocessing the last known SHA for this repo
-            last_known_sha_for_repo = LAST_PROCESSED_SHA.get(repo_full_name)
-            if last_known_sha_for_repo and commit_sha == last_known_sha_for_repo:
-                logger.debug(f"Skipping commit {commit_sha} for {repo_full_name} as it matches last known SHA {last_known_sha_for_repo}.")
-                continue
-
-            # Inner try-except for processing individual commits within the push
-            try:
-                # Construct RID
-                rid = GithubCommit(owner=repo_owner, repo=repo_name, sha=commit_sha)
-                
-                # Extract details - ensure keys exist
-                author = commit.get("author", {})
-                committer = commit.get("committer", {})
-                
-                contents = {
-                    "sha": commit_sha,
-                    "message": commit.get("message"),
-                    "author_name": author.get("name"),
-                    "author_email": author.get("email"),
-                    "author_date": commit.get("timestamp"), # GitHub often uses 'timestamp'
-                    "committer_name": committer.get("name"),
-                    "committer_email": committer.get("email"),
-                    "committer_date": committer.get("timestamp"),
-                    "html_url": commit.get("url"), # Use 'url' from webhook payload
-                    "parents": commit.get("parents", []) # Typically a list of SHAs in webhook
-                }
-                
-                bundle = Bundle.generate(rid=rid, contents=contents)
-                logger.debug(f"Bundling webhook commit {rid}")
-                node.processor.handle(bundle=bundle)
-                
-                processed_new_commit = True # Mark that we processed at least one new commit
-            
-            except Exception as e:
-                 logger.error(f"Error processing webhook commit {commit_sha} for {repo_full_name}: {e}", exc_info=True)
-                 # Decide whether to continue processing other commits in the push or stop
-                 continue # Continue with next commit in the webhook push
-        
-        # Update state file only if we processed a new commit and have a valid SHA representing the push tip
-        if processed_new_commit and sha_to_update_state:
-            # Check again if the sha_to_update is different from the stored one before writing
-            last_known_sha_for_repo = LAST_PROCESSED_SHA.get(repo_full_name)
-            if sha_to_update_state != last_known_sha_for_repo:
-                logger.info(f"Webhook processing complete for {repo_full_name}. Updating state to SHA: {sha_to_update_state}")
-                update_state_file(repo_full_name, sha_to_update_state) 
-            else:
-                 logger.info(f"Webhook processing complete for {repo_full_name}. State SHA {sha_to_update_state} already stored.")
+        commits_to_process = list({
+            commit["id"]: commit
+            for commit in (*commits, *([head_commit] if head_commit_id else []))
+            if commit.get("id")
+        }.values())
+        if not commits_to_process:
+             logger.warning("No processable commit data found in push event for %s. Skipping.", repo_full_name)
+             return Response(status_code=202)
+        # head_commit is the push tip; without it the last listed commit is the best candidate
+        sha_to_update_state = head_commit_id or commits_to_process[-1]["id"]
+        logger.debug("Processing %d commit(s). Potential state update SHA: %s", len(commits_to_process), sha_to_update_state)
+
+        # Avoid reprocessing the last known SHA for this repo
+        last_known_sha_for_repo = LAST_PROCESSED_SHA.get(repo_full_name)
+        results = [
+            (commit["id"], *_bundle_commit(commit, repo_owner, repo_name))
+            for commit in commits_to_process
+            if commit["id"] != last_known_sha_for_repo
+        ]
+        if len(results) < len(commits_to_process):
+            logger.debug("Skipping commit %s for %s as it matches last known SHA.", last_known_sha_for_repo, repo_full_name)
+        bundles = [bundle for _, bundle, _ in results if bundle is not None]
+        failed = [(commit_sha, str(err)) for commit_sha, _, err in results if err is not None]
+        if failed:
+            # One log line for the whole push; the remaining commits are still queued
+            logger.error("Failed to bundle %d webhook commit(s) for %s: %s", len(failed), repo_full_name, failed)
+
+        processed_new_commit = bool(bundles) # At least one new commit will be queued
+
+        # Update state only if we process a new commit and have a valid SHA representing the
+        # push tip that differs from the stored one
+        state_update = None
+        if processed_new_commit and sha_to_update_state and sha_to_update_state != LAST_PROCESSED_SHA.get(repo_full_name):
+            state_update = (repo_full_name, sha_to_update_state)
+
+        # The whole push is queued as one batch for the ingest consumer; answers 503 (and
+        # skips the state update) if the queue is full. The state update rides with the batch
+        # and is recorded once it reaches the processor, then written by the periodic state flush
+        if bundles:
+            enqueue_ingest(request.app, "bundles", [bundles], state_update=state_update)
+
+        if state_update:
+            logger.info("Webhook processing complete for %s. Updating state to SHA: %s", repo_full_name, sha_to_update_state)
+        elif processed_new_commit and sha_to_update_state:
+             logger.info("Webhook processing complete for %s. State SHA %s already stored.", repo_full_name, sha_to_update_state)
         elif processed_new_commit:
-             logger.warning(f"Webhook processing complete for {repo_full_name}. Processed new commit(s) but could not determine SHA for state update.")
+             logger.warning("Webhook processing complete for %s. Processed new commit(s) but could not determine SHA for state update.", repo_full_name)
         else:
-             logger.info(f"Webhook processing complete for {repo_full_name}. No new commits processed or state updated.")
+             logger.info("Webhook processing complete for %s. No new commits processed or state updated.", repo_full_name)
 
-        return {"message": "Webhook processed successfully"}
+        return Response(status_code=202)
 
     # Exception handlers are now correctly indented relative to the main 'try' block
     except HTTPException as he:
         # Re-raise HTTP exceptions to return proper status codes
-        logger.warning(f"HTTP Exception during webhook processing: {he.detail}")
+        logger.warning("HTTP Exception during webhook processing: %s", he.detail)
         raise he
     except Exception as e:
-        logger.error(f"Unexpected error handling webhook event {x_github_event}: {e}", exc_info=True)
+        logger.error("Unexpected error handling webhook event %s: %s", x_github_event, e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error handling webhook")
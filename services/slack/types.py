@@ -1,751 +1,397 @@
+from inspect import Parameter, Signature
+from string import Formatter
+from weakref import WeakValueDictionary
 from rid_lib.core import ORN
 
-class GithubCommit(ORN):
-    """
-    Resource Identifier (RID) for a specific GitHub commit.
-    
-    Format: orn:github.commit:<owner>/<repo>/<sha>
-    Example: orn:github.commit:microsoft/vscode/a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6q7r8s9t0
+# Longest numeric part accepted; GitHub issue, PR and run IDs are far shorter, and the
+# bound is checked before the digit scan so oversized input is rejected in O(1)
+_MAX_NUMBER_DIGITS = 20
+# Message of the ValueError raised by from_reference, filled in on the failure path only
+_REF_ERR = "Invalid reference format for {cls}. Expected '{fmt}', got '{got}'. Error: {error}"
+
+
+def _split_template(template: str, fields: tuple[str, ...]) -> tuple:
+    """Splits a '{field}' URL template into literal strings and indexes into the parts tuple."""
+    pieces = []
+    for literal, name, _, _ in Formatter().parse(template):
+        if literal:
+            pieces.append(literal)
+        if name is not None:
+            pieces.append(fields.index(name))
+    return tuple(pieces)
+
+
+def _part_property(index: int, name: str) -> property:
+    """Read-only property exposing one part of an instance's reference."""
+    return property(lambda self: self._parts[index], doc=f"The '{name}' part of the reference.")
+
+
+class _GithubORN:
     """
-    namespace = "github.commit"
+    Shared implementation of the GitHub ORN types below.
 
-    def __init__(self, owner: str, repo: str, sha: str):
-        """
-        Initialize a GitHub commit RID.
-        
-        Args:
-            owner: The repository owner (user or organization)
-            repo: The repository name
-            sha: The commit SHA (full 40-character or shortened)
-        """
-        if not owner or not repo or not sha:
-            raise ValueError("Owner, repo, and SHA cannot be empty")
-        
-        if "/" in owner or "/" in repo:
-            raise ValueError("Owner and repo cannot contain '/' character")
-            
-        self.owner = owner
-        self.repo = repo
-        self.sha = sha
+    Each type only declares its reference fields, URL templates and error wording; the
+    constructor, parsing, URLs, hashing and interning are implemented once here. This is
+    a plain mixin rather than an ORN subclass because rid-lib's metaclass requires every
+    RID subclass to define a namespace.
+    """
+    # The ORN base doesn't declare __slots__, so instances still get a __dict__,
+    # but these attributes are stored in slots and skip it
+    __slots__ = ("_parts", "_reference", "_html_url", "_api_url", "_hash")
+
+    _fields: tuple[str, ...] # Reference parts in order; also the constructor's parameters
+    _label: str # Subject of the "cannot be empty" error, e.g. "Owner, repo, and SHA"
+    _slash_parts: int | None = None # Leading parts that may not contain '/' (None: all of them)
+    _slash_label: str | None = None # Subject of the '/' error when it differs from _label
+    _number_label: str | None = None # Set when the last part must be a decimal number
+    _reference_rule: tuple | None = None # (check, message) applied to the last part by from_reference only
+    _html_template: str
+    _api_template: str
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = getattr(cls, "_fields", None)
+        if not fields:
+            return
+        # Live instances keyed by their parts. Constructing an RID that is already in use
+        # returns the same object; entries drop out once nothing else references them.
+        cls._interned = WeakValueDictionary()
+        cls._html_pieces = _split_template(cls._html_template, fields)
+        cls._api_pieces = _split_template(cls._api_template, fields)
+        cls._ref_format = "/".join(f"<{name}>" for name in fields)
+        for index, name in enumerate(fields):
+            setattr(cls, name, _part_property(index, name))
+        # Keeps help() and inspect showing the named constructor parameters
+        cls.__signature__ = Signature(
+            [Parameter(name, Parameter.POSITIONAL_OR_KEYWORD, annotation=str) for name in fields]
+        )
+
+    def __new__(cls, *parts: str, **named: str):
+        if named or len(parts) != len(cls._fields):
+            # Raises the usual TypeError for missing, extra or duplicate arguments
+            parts = cls.__signature__.bind(*parts, **named).args
+        obj = cls._interned.get(parts)
+        if obj is not None:
+            return obj
+
+        if not all(parts):
+            raise ValueError(f"{cls._label} cannot be empty")
+        for part in parts[:cls._slash_parts]:
+            if "/" in part:
+                raise ValueError(f"{cls._slash_label or cls._label} cannot contain '/' character")
+        if cls._number_label and not cls._number_ok(parts[-1]):
+            raise ValueError(cls._number_error(parts[-1]))
+
+        obj = super().__new__(cls)
+        obj._populate(parts)
+        return obj
+
+    def __init__(self, *parts: str, **named: str):
+        pass # Instances are fully built by __new__; RID declares __init__ abstract
+
+    def _populate(self, parts: tuple):
+        """Sets the parts, reference and hash; callers have already validated the parts."""
+        self._parts = parts
+        self._reference = "/".join(parts)
+        self._html_url = None # URLs are joined on first read, most RIDs never need them
+        self._api_url = None
+        # Equal instances always share a reference, so hashing the reference alone is
+        # consistent with RID's str-based __eq__
+        self._hash = hash(self._reference)
+        self._interned[parts] = self
 
     @property
     def reference(self) -> str:
-        """Returns the reference part of the RID: '<owner>/<repo>/<sha>'."""
-        return f"{self.owner}/{self.repo}/{self.sha}"
-    
-    @property
-    def repository_full_name(self) -> str:
-        """Returns the full repository name: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
-    
+        """Returns the reference part of the RID, its parts joined by '/'."""
+        return self._reference
+
     @property
     def html_url(self) -> str:
-        """Returns the HTML URL to view this commit on GitHub."""
-        return f"https://github.com/{self.owner}/{self.repo}/commit/{self.sha}"
-    
+        """Returns the HTML URL to view this resource on GitHub."""
+        if self._html_url is None:
+            parts = self._parts
+            self._html_url = "".join([parts[p] if p.__class__ is int else p for p in self._html_pieces])
+        return self._html_url
+
     @property
     def api_url(self) -> str:
-        """Returns the GitHub API URL for this commit."""
-        return f"https://api.github.com/repos/{self.owner}/{self.repo}/commits/{self.sha}"
+        """Returns the GitHub API URL for this resource."""
+        if self._api_url is None:
+            parts = self._parts
+            self._api_url = "".join([parts[p] if p.__class__ is int else p for p in self._api_pieces])
+        return self._api_url
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if type(other) is type(self):
+            return self._reference == other._reference
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # Rebuilt through the constructor: str hashes differ between processes, so the
+        # cached _hash must never be pickled
+        return (type(self), self._parts)
+
+    @classmethod
+    def _split(cls, reference: str) -> tuple | None:
+        """Splits a reference into non-empty parts, or returns None if it has the wrong shape."""
+        count = len(cls._fields)
+        if count == 1:
+            return (reference,) if reference and "/" not in reference else None
+        if count == 2:
+            # One C-level scan splits on the first '/'; any further '/' is left on the right
+            left, sep, right = reference.partition("/")
+            return (left, right) if sep and left and right and "/" not in right else None
+        i = reference.find("/")
+        j = reference.find("/", i + 1) if i >= 0 else -1
+        if j < 0:
+            return None
+        parts = (reference[:i], reference[i + 1:j], reference[j + 1:])
+        return parts if all(parts) else None
 
     @classmethod
-    def from_reference(cls, reference: str) -> "GithubCommit":
+    def _reference_error(cls, reference: str, parts: tuple | None) -> str | None:
+        """Describes why a reference was rejected, or returns None if it is valid."""
+        count = len(cls._fields)
+        if parts is None:
+            if count == 1:
+                return f"{cls._label} cannot be empty" if not reference else f"{cls._label} cannot contain '/' character"
+            if count == 2:
+                _, sep, right = reference.partition("/")
+                if not sep or "/" in right:
+                    return "Reference must contain exactly one '/' separator"
+            elif reference.count("/") < 2:
+                return "Reference must contain exactly two '/' separators"
+            return f"{cls._label} parts cannot be empty"
+        last = parts[-1]
+        if cls._number_label and not cls._number_ok(last):
+            return cls._number_error(last)
+        if cls._reference_rule and not cls._reference_rule[0](last):
+            return cls._reference_rule[1].format(last)
+        return None
+
+    @classmethod
+    def from_reference(cls, reference: str):
         """
-        Creates a GithubCommit instance from its reference string.
-        
+        Creates an instance from its reference string.
+
         Args:
-            reference: String in format '<owner>/<repo>/<sha>'
-            
+            reference: String in the type's reference format, e.g. '<owner>/<repo>/<sha>'
+
         Returns:
-            GithubCommit instance
-            
+            An instance of the RID type
+
         Raises:
             ValueError: If the reference format is invalid
         """
+        parts = cls._split(reference)
+        if parts is not None and cls._last_part_ok(parts[-1]):
+            return cls._from_parts(parts)
+        raise ValueError(_REF_ERR.format(
+            cls=cls.__name__, fmt=cls._ref_format, got=reference, error=cls._reference_error(reference, parts)
+        ))
+
+    @classmethod
+    def try_from_reference(cls, reference: str):
+        """
+        Like from_reference, but returns None for an invalid reference instead of raising.
+        Meant for bulk parsing where most strings are not references of this type, so no
+        exception or error message is built for them.
+        """
+        parts = cls._split(reference)
+        if parts is None or not cls._last_part_ok(parts[-1]):
+            return None
+        return cls._from_parts(parts)
+
+    @classmethod
+    def _last_part_ok(cls, last: str) -> bool:
+        """Applies the numeric and per-type rules to the last part of a parsed reference."""
+        if cls._number_label and not cls._number_ok(last):
+            return False
+        return not cls._reference_rule or cls._reference_rule[0](last)
+
+    @staticmethod
+    def _number_ok(number: str) -> bool:
+        """True for a run of at most _MAX_NUMBER_DIGITS decimal digits (no sign, space or '_')."""
+        return len(number) <= _MAX_NUMBER_DIGITS and number.isdecimal()
+
+    @classmethod
+    def _number_error(cls, number: str) -> str:
+        """Error for a numeric part rejected by _number_ok; oversized input isn't echoed back."""
+        if len(number) > _MAX_NUMBER_DIGITS:
+            return f"{cls._number_label} must be at most {_MAX_NUMBER_DIGITS} digits"
+        return f"{cls._number_label} must be numeric: {number}"
+
+    @classmethod
+    def _from_parts(cls, parts: tuple):
+        """Builds an instance from already-validated parts without re-running the constructor's checks."""
+        obj = cls._interned.get(parts)
+        if obj is None:
+            obj = super().__new__(cls)
+            obj._populate(parts)
+        return obj
+
+
+class _RepoScopedORN(_GithubORN):
+    """GitHub ORN types whose reference starts with '<owner>/<repo>'."""
+    __slots__ = ("_repo_full",)
+
+    # Only the owner and repo are checked for '/' by the constructor
+    _slash_parts = 2
+    _slash_label = "Owner and repo"
+
+    @property
+    def repository_full_name(self) -> str:
+        """Returns the full repository name: '<owner>/<repo>'."""
         try:
-            parts = reference.split("/", maxsplit=2)
-            if len(parts) != 3:
-                raise ValueError("Reference must contain exactly two '/' separators")
-                
-            owner, repo, sha = parts
-            
-            if not owner or not repo or not sha:
-                raise ValueError("Owner, repo, and SHA parts cannot be empty")
-                
-            # Basic SHA length check
-            if len(sha) < 7:  # Minimum length for a short SHA
-                raise ValueError(f"SHA part seems too short: {sha}")
-                
-            return cls(owner=owner, repo=repo, sha=sha)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubCommit. Expected '<owner>/<repo>/<sha>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubCommit reference '{reference}': {e}") from e
-
-
-class GithubIssue(ORN):
+            return self._repo_full
+        except AttributeError: # Unset slot: built on first read
+            self._repo_full = "/".join(self._parts[:2])
+            return self._repo_full
+
+
+class GithubCommit(_RepoScopedORN, ORN):
+    """
+    Resource Identifier (RID) for a specific GitHub commit.
+
+    Format: orn:github.commit:<owner>/<repo>/<sha>
+    Example: orn:github.commit:microsoft/vscode/a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6q7r8s9t0
+    """
+    namespace = "github.commit"
+    __slots__ = ()
+    _fields = ("owner", "repo", "sha")
+    _label = "Owner, repo, and SHA"
+    _reference_rule = (lambda sha: len(sha) >= 7, "SHA part seems too short: {}") # Minimum length for a short SHA
+    _html_template = "https://github.com/{owner}/{repo}/commit/{sha}"
+    _api_template = "https://api.github.com/repos/{owner}/{repo}/commits/{sha}"
+
+
+class GithubIssue(_RepoScopedORN, ORN):
     """
     Resource Identifier (RID) for a specific GitHub issue.
-    
+
     Format: orn:github.issue:<owner>/<repo>/<number>
     Example: orn:github.issue:microsoft/vscode/12345
     """
     namespace = "github.issue"
+    __slots__ = ()
+    _fields = ("owner", "repo", "number")
+    _label = "Owner, repo, and issue number"
+    _number_label = "Issue number"
+    _html_template = "https://github.com/{owner}/{repo}/issues/{number}"
+    _api_template = "https://api.github.com/repos/{owner}/{repo}/issues/{number}"
 
-    def __init__(self, owner: str, repo: str, number: str):
-        """
-        Initialize a GitHub issue RID.
-        
-        Args:
-            owner: The repository owner (user or organization)
-            repo: The repository name
-            number: The issue number (as a string)
-        """
-        if not owner or not repo or not number:
-            raise ValueError("Owner, repo, and issue number cannot be empty")
-            
-        if "/" in owner or "/" in repo:
-            raise ValueError("Owner and repo cannot contain '/' character")
-            
-        # Validate issue number is numeric
-        try:
-            int(number)
-        except ValueError:
-            raise ValueError(f"Issue number must be numeric: {number}")
-            
-        self.owner = owner
-        self.repo = repo
-        self.number = number
-
-    @property
-    def reference(self) -> str:
-        """Returns the reference part of the RID: '<owner>/<repo>/<number>'."""
-        return f"{self.owner}/{self.repo}/{self.number}"
-    
-    @property
-    def repository_full_name(self) -> str:
-        """Returns the full repository name: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
-    
-    @property
-    def html_url(self) -> str:
-        """Returns the HTML URL to view this issue on GitHub."""
-        return f"https://github.com/{self.owner}/{self.repo}/issues/{self.number}"
-    
-    @property
-    def api_url(self) -> str:
-        """Returns the GitHub API URL for this issue."""
-        return f"https://api.github.com/repos/{self.owner}/{self.repo}/issues/{self.number}"
 
-    @classmethod
-    def from_reference(cls, reference: str) -> "GithubIssue":
-        """
-        Creates a GithubIssue instance from its reference string.
-        
-        Args:
-            reference: String in format '<owner>/<repo>/<number>'
-            
-        Returns:
-            GithubIssue instance
-            
-        Raises:
-            ValueError: If the reference format is invalid
-        """
-        try:
-            parts = reference.split("/", maxsplit=2)
-            if len(parts) != 3:
-                raise ValueError("Reference must contain exactly two '/' separators")
-                
-            owner, repo, number = parts
-            
-            if not owner or not repo or not number:
-                raise ValueError("Owner, repo, and issue number parts cannot be empty")
-                
-            # Validate issue number is numeric
-            try:
-                int(number)
-            except ValueError:
-                raise ValueError(f"Issue number must be numeric: {number}")
-                
-            return cls(owner=owner, repo=repo, number=number)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubIssue. Expected '<owner>/<repo>/<number>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubIssue reference '{reference}': {e}") from e
-
-
-class GithubPullRequest(ORN):
+class GithubPullRequest(_RepoScopedORN, ORN):
     """
     Resource Identifier (RID) for a specific GitHub pull request.
-    
+
     Format: orn:github.pull:<owner>/<repo>/<number>
     Example: orn:github.pull:microsoft/vscode/6789
     """
     namespace = "github.pull"
+    __slots__ = ()
+    _fields = ("owner", "repo", "number")
+    _label = "Owner, repo, and PR number"
+    _number_label = "Pull request number"
+    _html_template = "https://github.com/{owner}/{repo}/pull/{number}"
+    _api_template = "https://api.github.com/repos/{owner}/{repo}/pulls/{number}"
 
-    def __init__(self, owner: str, repo: str, number: str):
-        """
-        Initialize a GitHub pull request RID.
-        
-        Args:
-            owner: The repository owner (user or organization)
-            repo: The repository name
-            number: The pull request number (as a string)
-        """
-        if not owner or not repo or not number:
-            raise ValueError("Owner, repo, and PR number cannot be empty")
-            
-        if "/" in owner or "/" in repo:
-            raise ValueError("Owner and repo cannot contain '/' character")
-            
-        # Validate PR number is numeric
-        try:
-            int(number)
-        except ValueError:
-            raise ValueError(f"Pull request number must be numeric: {number}")
-            
-        self.owner = owner
-        self.repo = repo
-        self.number = number
-
-    @property
-    def reference(self) -> str:
-        """Returns the reference part of the RID: '<owner>/<repo>/<number>'."""
-        return f"{self.owner}/{self.repo}/{self.number}"
-    
-    @property
-    def repository_full_name(self) -> str:
-        """Returns the full repository name: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
-    
-    @property
-    def html_url(self) -> str:
-        """Returns the HTML URL to view this pull request on GitHub."""
-        return f"https://github.com/{self.owner}/{self.repo}/pull/{self.number}"
-    
-    @property
-    def api_url(self) -> str:
-        """Returns the GitHub API URL for this pull request."""
-        return f"https://api.github.com/repos/{self.owner}/{self.repo}/pulls/{self.number}"
 
-    @classmethod
-    def from_reference(cls, reference: str) -> "GithubPullRequest":
-        """
-        Creates a GithubPullRequest instance from its reference string.
-        
-        Args:
-            reference: String in format '<owner>/<repo>/<number>'
-            
-        Returns:
-            GithubPullRequest instance
-            
-        Raises:
-            ValueError: If the reference format is invalid
-        """
-        try:
-            parts = reference.split("/", maxsplit=2)
-            if len(parts) != 3:
-                raise ValueError("Reference must contain exactly two '/' separators")
-                
-            owner, repo, number = parts
-            
-            if not owner or not repo or not number:
-                raise ValueError("Owner, repo, and PR number parts cannot be empty")
-                
-            # Validate PR number is numeric
-            try:
-                int(number)
-            except ValueError:
-                raise ValueError(f"Pull request number must be numeric: {number}")
-                
-            return cls(owner=owner, repo=repo, number=number)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubPullRequest. Expected '<owner>/<repo>/<number>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubPullRequest reference '{reference}': {e}") from e
-
-
-class GithubRelease(ORN):
+class GithubRelease(_RepoScopedORN, ORN):
     """
     Resource Identifier (RID) for a specific GitHub release.
-    
+
     Format: orn:github.release:<owner>/<repo>/<tag>
     Example: orn:github.release:microsoft/vscode/v1.60.0
     """
     namespace = "github.release"
+    __slots__ = ()
+    _fields = ("owner", "repo", "tag")
+    _label = "Owner, repo, and tag"
+    _slash_parts = None # The tag is checked for '/' as well
+    _slash_label = None
+    _reference_rule = (lambda tag: "/" not in tag, "Owner, repo, and tag cannot contain '/' character")
+    _html_template = "https://github.com/{owner}/{repo}/releases/tag/{tag}"
+    _api_template = "https://api.github.com/repos/{owner}/{repo}/releases/tags/{tag}"
 
-    def __init__(self, owner: str, repo: str, tag: str):
-        """
-        Initialize a GitHub release RID.
-        
-        Args:
-            owner: The repository owner (user or organization)
-            repo: The repository name
-            tag: The release tag
-        """
-        if not owner or not repo or not tag:
-            raise ValueError("Owner, repo, and tag cannot be empty")
-            
-        if "/" in owner or "/" in repo or "/" in tag:
-            raise ValueError("Owner, repo, and tag cannot contain '/' character")
-            
-        self.owner = owner
-        self.repo = repo
-        self.tag = tag
-
-    @property
-    def reference(self) -> str:
-        """Returns the reference part of the RID: '<owner>/<repo>/<tag>'."""
-        return f"{self.owner}/{self.repo}/{self.tag}"
-    
-    @property
-    def repository_full_name(self) -> str:
-        """Returns the full repository name: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
-    
-    @property
-    def html_url(self) -> str:
-        """Returns the HTML URL to view this release on GitHub."""
-        return f"https://github.com/{self.owner}/{self.repo}/releases/tag/{self.tag}"
-    
-    @property
-    def api_url(self) -> str:
-        """Returns the GitHub API URL for this release."""
-        return f"https://api.github.com/repos/{self.owner}/{self.repo}/releases/tags/{self.tag}"
 
-    @classmethod
-    def from_reference(cls, reference: str) -> "GithubRelease":
-        """
-        Creates a GithubRelease instance from its reference string.
-        
-        Args:
-            reference: String in format '<owner>/<repo>/<tag>'
-            
-        Returns:
-            GithubRelease instance
-            
-        Raises:
-            ValueError: If the reference format is invalid
-        """
-        try:
-            parts = reference.split("/", maxsplit=2)
-            if len(parts) != 3:
-                raise ValueError("Reference must contain exactly two '/' separators")
-                
-            owner, repo, tag = parts
-            
-            if not owner or not repo or not tag:
-                raise ValueError("Owner, repo, and tag parts cannot be empty")
-                
-            return cls(owner=owner, repo=repo, tag=tag)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubRelease. Expected '<owner>/<repo>/<tag>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubRelease reference '{reference}': {e}") from e
-
-
-class GithubRepository(ORN):
+class GithubRepository(_RepoScopedORN, ORN):
     """
     Resource Identifier (RID) for a GitHub repository.
-    
+
     Format: orn:github.repo:<owner>/<repo>
     Example: orn:github.repo:microsoft/vscode
     """
     namespace = "github.repo"
+    __slots__ = ()
+    _fields = ("owner", "repo")
+    _label = "Owner and repo"
+    _html_template = "https://github.com/{owner}/{repo}"
+    _api_template = "https://api.github.com/repos/{owner}/{repo}"
 
-    def __init__(self, owner: str, repo: str):
-        """
-        Initialize a GitHub repository RID.
-        
-        Args:
-            owner: The repository owner (user or organization)
-            repo: The repository name
-        """
-        if not owner or not repo:
-            raise ValueError("Owner and repo cannot be empty")
-            
-        if "/" in owner or "/" in repo:
-            raise ValueError("Owner and repo cannot contain '/' character")
-            
-        self.owner = owner
-        self.repo = repo
 
-    @property
-    def reference(self) -> str:
-        """Returns the reference part of the RID: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
-    
-    @property
-    def repository_full_name(self) -> str:
-        """Returns the full repository name: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
-    
-    @property
-    def html_url(self) -> str:
-        """Returns the HTML URL to view this repository on GitHub."""
-        return f"https://github.com/{self.owner}/{self.repo}"
-    
-    @property
-    def api_url(self) -> str:
-        """Returns the GitHub API URL for this repository."""
-        return f"https://api.github.com/repos/{self.owner}/{self.repo}"
-
-    @classmethod
-    def from_reference(cls, reference: str) -> "GithubRepository":
-        """
-        Creates a GithubRepository instance from its reference string.
-        
-        Args:
-            reference: String in format '<owner>/<repo>'
-            
-        Returns:
-            GithubRepository instance
-            
-        Raises:
-            ValueError: If the reference format is invalid
-        """
-        try:
-            parts = reference.split("/")
-            if len(parts) != 2:
-                raise ValueError("Reference must contain exactly one '/' separator")
-                
-            owner, repo = parts
-            
-            if not owner or not repo:
-                raise ValueError("Owner and repo parts cannot be empty")
-                
-            return cls(owner=owner, repo=repo)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubRepository. Expected '<owner>/<repo>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubRepository reference '{reference}': {e}") from e
-
-
-class GithubUser(ORN):
+class GithubUser(_GithubORN, ORN):
     """
     Resource Identifier (RID) for a GitHub user or organization.
-    
+
     Format: orn:github.user:<username>
     Example: orn:github.user:octocat
     """
     namespace = "github.user"
+    __slots__ = ()
+    _fields = ("username",)
+    _label = "Username"
+    _html_template = "https://github.com/{username}"
+    _api_template = "https://api.github.com/users/{username}"
 
-    def __init__(self, username: str):
-        """
-        Initialize a GitHub user RID.
-        
-        Args:
-            username: The GitHub username
-        """
-        if not username:
-            raise ValueError("Username cannot be empty")
-            
-        if "/" in username:
-            raise ValueError("Username cannot contain '/' character")
-            
-        self.username = username
 
-    @property
-    def reference(self) -> str:
-        """Returns the reference part of the RID: '<username>'."""
-        return self.username
-    
-    @property
-    def html_url(self) -> str:
-        """Returns the HTML URL to view this user on GitHub."""
-        return f"https://github.com/{self.username}"
-    
-    @property
-    def api_url(self) -> str:
-        """Returns the GitHub API URL for this user."""
-        return f"https://api.github.com/users/{self.username}"
-
-    @classmethod
-    def from_reference(cls, reference: str) -> "GithubUser":
-        """
-        Creates a GithubUser instance from its reference string.
-        
-        Args:
-            reference: String containing the username
-            
-        Returns:
-            GithubUser instance
-            
-        Raises:
-            ValueError: If the reference format is invalid
-        """
-        try:
-            if not reference:
-                raise ValueError("Username cannot be empty")
-                
-            if "/" in reference:
-                raise ValueError("Username cannot contain '/' character")
-                
-            return cls(username=reference)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubUser. Expected '<username>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubUser reference '{reference}': {e}") from e
-
-
-class GithubDiscussion(ORN):
+class GithubDiscussion(_RepoScopedORN, ORN):
     """
     Resource Identifier (RID) for a GitHub discussion.
-    
+
     Format: orn:github.discussion:<owner>/<repo>/<number>
     Example: orn:github.discussion:microsoft/vscode/4242
     """
     namespace = "github.discussion"
+    __slots__ = ()
+    _fields = ("owner", "repo", "number")
+    _label = "Owner, repo, and discussion number"
+    _number_label = "Discussion number"
+    _html_template = "https://github.com/{owner}/{repo}/discussions/{number}"
+    _api_template = "https://api.github.com/graphql" # GraphQL endpoint - would require a proper query
 
-    def __init__(self, owner: str, repo: str, number: str):
-        """
-        Initialize a GitHub discussion RID.
-        
-        Args:
-            owner: The repository owner (user or organization)
-            repo: The repository name
-            number: The discussion number (as a string)
-        """
-        if not owner or not repo or not number:
-            raise ValueError("Owner, repo, and discussion number cannot be empty")
-            
-        if "/" in owner or "/" in repo:
-            raise ValueError("Owner and repo cannot contain '/' character")
-            
-        # Validate discussion number is numeric
-        try:
-            int(number)
-        except ValueError:
-            raise ValueError(f"Discussion number must be numeric: {number}")
-            
-        self.owner = owner
-        self.repo = repo
-        self.number = number
-
-    @property
-    def reference(self) -> str:
-        """Returns the reference part of the RID: '<owner>/<repo>/<number>'."""
-        return f"{self.owner}/{self.repo}/{self.number}"
-    
-    @property
-    def repository_full_name(self) -> str:
-        """Returns the full repository name: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
-    
-    @property
-    def html_url(self) -> str:
-        """Returns the HTML URL to view this discussion on GitHub."""
-        return f"https://github.com/{self.owner}/{self.repo}/discussions/{self.number}"
-    
-    @property
-    def api_url(self) -> str:
-        """Returns the GitHub API URL for this discussion (GraphQL)."""
-        return f"https://api.github.com/graphql"  # GraphQL endpoint - would require a proper query
 
-    @classmethod
-    def from_reference(cls, reference: str) -> "GithubDiscussion":
-        """
-        Creates a GithubDiscussion instance from its reference string.
-        
-        Args:
-            reference: String in format '<owner>/<repo>/<number>'
-            
-        Returns:
-            GithubDiscussion instance
-            
-        Raises:
-            ValueError: If the reference format is invalid
-        """
-        try:
-            parts = reference.split("/", maxsplit=2)
-            if len(parts) != 3:
-                raise ValueError("Reference must contain exactly two '/' separators")
-                
-            owner, repo, number = parts
-            
-            if not owner or not repo or not number:
-                raise ValueError("Owner, repo, and discussion number parts cannot be empty")
-                
-            # Validate discussion number is numeric
-            try:
-                int(number)
-            except ValueError:
-                raise ValueError(f"Discussion number must be numeric: {number}")
-                
-            return cls(owner=owner, repo=repo, number=number)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubDiscussion. Expected '<owner>/<repo>/<number>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubDiscussion reference '{reference}': {e}") from e
-
-
-class GithubAction(ORN):
+class GithubAction(_RepoScopedORN, ORN):
     """
     Resource Identifier (RID) for a GitHub Actions workflow run.
-    
+
     Format: orn:github.action:<owner>/<repo>/<run_id>
     Example: orn:github.action:microsoft/vscode/12345678
     """
     namespace = "github.action"
+    __slots__ = ()
+    _fields = ("owner", "repo", "run_id")
+    _label = "Owner, repo, and run ID"
+    _number_label = "Run ID"
+    _html_template = "https://github.com/{owner}/{repo}/actions/runs/{run_id}"
+    _api_template = "https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}"
 
-    def __init__(self, owner: str, repo: str, run_id: str):
-        """
-        Initialize a GitHub Actions workflow run RID.
-        
-        Args:
-            owner: The repository owner (user or organization)
-            repo: The repository name
-            run_id: The workflow run ID (as a string)
-        """
-        if not owner or not repo or not run_id:
-            raise ValueError("Owner, repo, and run ID cannot be empty")
-            
-        if "/" in owner or "/" in repo:
-            raise ValueError("Owner and repo cannot contain '/' character")
-            
-        # Validate run ID is numeric
-        try:
-            int(run_id)
-        except ValueError:
-            raise ValueError(f"Run ID must be numeric: {run_id}")
-            
-        self.owner = owner
-        self.repo = repo
-        self.run_id = run_id
-
-    @property
-    def reference(self) -> str:
-        """Returns the reference part of the RID: '<owner>/<repo>/<run_id>'."""
-        return f"{self.owner}/{self.repo}/{self.run_id}"
-    
-    @property
-    def repository_full_name(self) -> str:
-        """Returns the full repository name: '<owner>/<repo>'."""
-        return f"{self.owner}/{self.repo}"
-    
-    @property
-    def html_url(self) -> str:
-        """Returns the HTML URL to view this workflow run on GitHub."""
-        return f"https://github.com/{self.owner}/{self.repo}/actions/runs/{self.run_id}"
-    
-    @property
-    def api_url(self) -> str:
-        """Returns the GitHub API URL for this workflow run."""
-        return f"https://api.github.com/repos/{self.owner}/{self.repo}/actions/runs/{self.run_id}"
 
-    @classmethod
-    def from_reference(cls, reference: str) -> "GithubAction":
-        """
-        Creates a GithubAction instance from its reference string.
-        
-        Args:
-            reference: String in format '<owner>/<repo>/<run_id>'
-            
-        Returns:
-            GithubAction instance
-            
-        Raises:
-            ValueError: If the reference format is invalid
-        """
-        try:
-            parts = reference.split("/", maxsplit=2)
-            if len(parts) != 3:
-                raise ValueError("Reference must contain exactly two '/' separators")
-                
-            owner, repo, run_id = parts
-            
-            if not owner or not repo or not run_id:
-                raise ValueError("Owner, repo, and run ID parts cannot be empty")
-                
-            # Validate run ID is numeric
-            try:
-                int(run_id)
-            except ValueError:
-                raise ValueError(f"Run ID must be numeric: {run_id}")
-                
-            return cls(owner=owner, repo=repo, run_id=run_id)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubAction. Expected '<owner>/<repo>/<run_id>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubAction reference '{reference}': {e}") from e
-
-
-class GithubGist(ORN):
+class GithubGist(_GithubORN, ORN):
     """
     Resource Identifier (RID) for a GitHub Gist.
-    
+
     Format: orn:github.gist:<username>/<gist_id>
     Example: orn:github.gist:octocat/aa5a315d61ae9438b18d
     """
     namespace = "github.gist"
-
-    def __init__(self, username: str, gist_id: str):
-        """
-        Initialize a GitHub Gist RID.
-        
-        Args:
-            username: The owner of the gist
-            gist_id: The gist ID
-        """
-        if not username or not gist_id:
-            raise ValueError("Username and gist ID cannot be empty")
-            
-        if "/" in username or "/" in gist_id:
-            raise ValueError("Username and gist ID cannot contain '/' character")
-            
-        self.username = username
-        self.gist_id = gist_id
-
-    @property
-    def reference(self) -> str:
-        """Returns the reference part of the RID: '<username>/<gist_id>'."""
-        return f"{self.username}/{self.gist_id}"
-    
-    @property
-    def html_url(self) -> str:
-        """Returns the HTML URL to view this gist on GitHub."""
-        return f"https://gist.github.com/{self.username}/{self.gist_id}"
-    
-    @property
-    def api_url(self) -> str:
-        """Returns the GitHub API URL for this gist."""
-        return f"https://api.github.com/gists/{self.gist_id}"
-
-    @classmethod
-    def from_reference(cls, reference: str) -> "GithubGist":
-        """
-        Creates a GithubGist instance from its reference string.
-        
-        Args:
-            reference: String in format '<username>/<gist_id>'
-            
-        Returns:
-            GithubGist instance
-            
-        Raises:
-            ValueError: If the reference format is invalid
-        """
-        try:
-            parts = reference.split("/")
-            if len(parts) != 2:
-                raise ValueError("Reference must contain exactly one '/' separator")
-                
-            username, gist_id = parts
-            
-            if not username or not gist_id:
-                raise ValueError("Username and gist ID parts cannot be empty")
-                
-            return cls(username=username, gist_id=gist_id)
-            
-        except ValueError as e:
-            raise ValueError(f"Invalid reference format for GithubGist. Expected '<username>/<gist_id>', got '{reference}'. Error: {e}") from e
-        except Exception as e:
-            raise TypeError(f"Unexpected error parsing GithubGist reference '{reference}': {e}") from e
\ No newline at end of file
+    __slots__ = ()
+    _fields = ("username", "gist_id")
+    _label = "Username and gist ID"
+    _html_template = "https://gist.github.com/{username}/{gist_id}"
+    _api_template = "https://api.github.com/gists/{gist_id}"
\ No newline at end of file